@@ -2,93 +2,142 @@
 Claude Bridge - Monitors Claude Code state via a shared state file.
 
 Claude Code hooks write state strings (e.g., "working", "thinking") to a file,
-and the pet app polls that file to drive animations.
+and the pet app watches that file (inotify via Gio, polling as a fallback)
+to drive animations.
 
 Valid states: "idle", "thinking", "working", "attention", "celebrating", "doubling"
+
+Timers: while the file monitor is active, the only recurring GLib timer is
+the idle timeout, which uses timeout_add_seconds() so GLib can coalesce its
+wakeups with other processes.  The millisecond timers below are either
+one-shot (the per-burst flush) or only used when no monitor is available
+(the poll fallback).  Keep it that way so an idle pet stays tickless.
 """
 
+import logging
 import os
 import time
 
-VALID_STATES = {"idle", "thinking", "working", "attention", "celebrating", "doubling"}
+try:
+    from gi.repository import Gio, GLib
+except ImportError:
+    # get_state()/write_state() still work without PyGObject;
+    # only start_watching() needs the GLib main loop.
+    Gio = None
+    GLib = None
+
+logger = logging.getLogger(__name__)
+
+VALID_STATES: frozenset[str] = frozenset(
+    {"idle", "thinking", "working", "attention", "celebrating", "doubling"}
+)
+_VALID_STATES_SORTED = ", ".join(sorted(VALID_STATES))
 DEFAULT_STATE = "idle"
 POLL_INTERVAL_MS = 300
+FLUSH_INTERVAL_MS = 1000 // 60  # coalesce file events to one dispatch per frame
 IDLE_TIMEOUT_S = 60
 
 
 class ClaudeBridge:
+    __slots__ = (
+        "state_file", "current_state", "_callback", "_watching",
+        "_last_mtime", "_timeout_id", "_monitor", "_idle_timeout_id",
+        "_pending", "_pending_state", "_flush_id",
+    )
+
     def __init__(self, state_file: str = "/tmp/claude-pet-state"):
         self.state_file = state_file
         self.current_state = DEFAULT_STATE
         self._callback = None
         self._watching = False
-        self._last_mtime = 0.0
+        self._last_mtime: int = 0
         self._timeout_id = None
+        self._monitor = None
         self._idle_timeout_id = None
+        self._pending = False
+        self._pending_state = None
+        self._flush_id = None
 
     def get_state(self) -> str:
         """Read current state from file. Returns 'idle' if file doesn't exist
         or contains invalid data."""
         try:
-            if not os.path.exists(self.state_file):
-                return DEFAULT_STATE
-
-            with open(self.state_file, "r") as f:
-                raw = f.read().strip()
-
-            if not raw:
-                return DEFAULT_STATE
-
-            # Only accept known states
-            state = raw.lower()
-            if state in VALID_STATES:
-                return state
-
+            # Single open() instead of exists() + open(); state strings are
+            # short, so a bounded read is plenty
+            with open(self.state_file, "rb") as f:
+                raw = f.read(64)
+        except OSError:
+            # File missing, disappeared, permissions changed, etc. — just go idle.
             return DEFAULT_STATE
 
-        except (OSError, PermissionError, IOError):
-            # File disappeared, permissions changed, etc. — just go idle.
-            return DEFAULT_STATE
+        # Only accept known states
+        state = raw.strip().lower().decode("ascii", "ignore")
+        if state in VALID_STATES:
+            return state
+
+        return DEFAULT_STATE
 
     def start_watching(self, callback) -> None:
-        """Start polling the state file every 300ms.
+        """Start watching the state file for changes.
 
         Calls callback(new_state) when the state changes.
-        Uses GLib.timeout_add for GTK main-loop compatibility.
+        Prefers a Gio directory monitor (inotify) so the process sleeps
+        until a hook actually writes the file; falls back to polling every
+        300ms if the monitor can't be created (e.g. unsupported filesystem).
 
-        Also starts an idle timeout: if no state change happens within 30
-        seconds, automatically transition to 'idle'.
+        Also starts an idle timeout: if no state change happens within
+        IDLE_TIMEOUT_S seconds, automatically transition to 'idle'.
         """
-        from gi.repository import GLib
-
         if self._watching:
             self.stop_watching()
 
         self._callback = callback
         self._watching = True
 
-        # Read initial state so we don't fire a spurious callback on first poll
+        # Read initial state so we don't fire a spurious callback on first event
         self.current_state = self.get_state()
         try:
-            self._last_mtime = os.path.getmtime(self.state_file)
+            self._last_mtime = os.stat(self.state_file).st_mtime_ns
         except OSError:
-            self._last_mtime = 0.0
+            self._last_mtime = 0
 
-        # Start the poll timer
-        self._timeout_id = GLib.timeout_add(POLL_INTERVAL_MS, self._check_state)
+        if not self._start_monitor():
+            # No file monitor available — poll instead
+            self._timeout_id = GLib.timeout_add(POLL_INTERVAL_MS, self._check_state)
 
         # Start the idle-timeout timer
         self._idle_timeout_id = GLib.timeout_add_seconds(
             IDLE_TIMEOUT_S, self._idle_timeout
         )
 
-    def stop_watching(self) -> None:
-        """Stop polling and cancel all timers."""
-        from gi.repository import GLib
+    def _start_monitor(self) -> bool:
+        """Watch the state file's directory with a Gio file monitor.
+
+        The directory is watched (not the file) so the watch survives the
+        file being deleted and recreated.  Events are filtered by basename.
+        Returns False if no monitor could be created.
+        """
+        try:
+            directory = os.path.dirname(os.path.abspath(self.state_file))
+            monitor = Gio.File.new_for_path(directory).monitor_directory(
+                Gio.FileMonitorFlags.NONE, None
+            )
+        except Exception:
+            return False
 
+        self._monitor = monitor
+        self._monitor.connect("changed", self._on_monitor_event)
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop watching and cancel all timers."""
         self._watching = False
         self._callback = None
 
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
+
         if self._timeout_id is not None:
             GLib.source_remove(self._timeout_id)
             self._timeout_id = None
@@ -97,31 +146,80 @@ class ClaudeBridge:
             GLib.source_remove(self._idle_timeout_id)
             self._idle_timeout_id = None
 
+        if self._flush_id is not None:
+            GLib.source_remove(self._flush_id)
+            self._flush_id = None
+        self._pending = False
+        self._pending_state = None
+
+    def _on_monitor_event(self, monitor, file, other_file, event_type) -> None:
+        """Gio monitor callback.  Only reacts to completed writes or the
+        file (re)appearing — not every intermediate CHANGED event."""
+        if not self._watching:
+            return
+        if event_type not in (Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+                              Gio.FileMonitorEvent.CREATED):
+            return
+        if file.get_basename() != os.path.basename(self.state_file):
+            return
+        self._notify(self.get_state())
+
     def _check_state(self) -> bool:
-        """Poll callback.  Read the file, compare with current state,
-        fire the callback if the state changed.
+        """Poll callback (fallback when no file monitor is available).
+        Read the file, compare with current state, fire the callback if
+        the state changed.
 
-        Returns True to keep the GLib timeout active.
+        Returns SOURCE_CONTINUE to keep the GLib timeout active.
         """
         if not self._watching:
-            return False  # stop the timer
+            self._timeout_id = None
+            return GLib.SOURCE_REMOVE  # stop the timer
 
-        # Quick-check: skip the read if mtime hasn't changed
+        # Quick-check: skip the read if mtime hasn't changed.  Integer
+        # nanoseconds so rapid consecutive writes don't round together.
         try:
-            mtime = os.path.getmtime(self.state_file)
+            mtime = os.stat(self.state_file).st_mtime_ns
         except OSError:
-            mtime = 0.0
+            mtime = 0
 
         if mtime == self._last_mtime:
-            return True  # no change, keep polling
+            return GLib.SOURCE_CONTINUE  # no change, keep polling
 
         self._last_mtime = mtime
-        new_state = self.get_state()
+        self._notify(self.get_state())
+        return GLib.SOURCE_CONTINUE  # keep polling
+
+    def _notify(self, new_state: str) -> None:
+        """Record a state-file change and schedule a flush.
+
+        Bursts of writes (e.g. two hooks firing a few ms apart, or the
+        CREATED + CHANGES_DONE_HINT pair on a fresh file) are coalesced
+        into one dispatch per FLUSH_INTERVAL_MS.  This is a bounded flush,
+        not a debounce: a steady stream of writes still dispatches once
+        per interval instead of starving.
+        """
+        self._pending_state = new_state
+        if not self._pending:
+            self._pending = True
+            self._flush_id = GLib.timeout_add(FLUSH_INTERVAL_MS, self._flush_pending)
+
+    def _flush_pending(self) -> bool:
+        """Dispatch the latest coalesced state to the callback.
 
-        # Always notify on file change (mtime changed = someone wrote to it).
-        # The character's set_state() handles dedup if already in that state.
-        # This lets re-writing the same state (e.g. "celebrating" twice)
-        # properly re-trigger animations.
+        Returns SOURCE_REMOVE so the flush timer fires only once.
+        """
+        new_state = self._pending_state
+        self._pending = False
+        self._pending_state = None
+        self._flush_id = None
+
+        if not self._watching or new_state is None:
+            return GLib.SOURCE_REMOVE
+
+        # Dispatch every write, even a repeat of current_state: the pet
+        # drops states that arrive during a manual override, and the next
+        # rewrite (e.g. the "working" of the following tool call) is what
+        # brings it back in sync.  The pet skips states it already shows.
         self.current_state = new_state
 
         # Reset the idle timeout whenever the file is touched
@@ -131,15 +229,13 @@ class ClaudeBridge:
             try:
                 self._callback(new_state)
             except Exception:
-                # Don't let a bad callback kill the poll loop
-                pass
+                # Don't let a bad callback kill the watcher
+                logger.debug("State callback failed", exc_info=True)
 
-        return True  # keep polling
+        return GLib.SOURCE_REMOVE
 
     def _reset_idle_timeout(self) -> None:
         """Cancel and restart the idle timeout timer."""
-        from gi.repository import GLib
-
         if self._idle_timeout_id is not None:
             GLib.source_remove(self._idle_timeout_id)
 
@@ -151,16 +247,21 @@ class ClaudeBridge:
         """Fired when no state change has occurred for IDLE_TIMEOUT_S seconds.
         Transitions to 'idle' and notifies the callback.
 
-        Returns False so GLib does NOT reschedule this timer automatically;
-        _reset_idle_timeout will create a fresh one on the next state change.
+        Returns SOURCE_REMOVE so GLib does NOT reschedule this timer
+        automatically; _reset_idle_timeout will create a fresh one on the
+        next state change.
         """
+        # This source is being dispatched and will be removed on return;
+        # forget its ID so _reset_idle_timeout doesn't remove it twice.
+        self._idle_timeout_id = None
+
         if not self._watching:
-            return False
+            return GLib.SOURCE_REMOVE
 
         if self.current_state == "attention":
             # Attention persists until a real state change (user handles permission)
             self._reset_idle_timeout()
-            return False
+            return GLib.SOURCE_REMOVE
 
         if self.current_state != DEFAULT_STATE:
             self.current_state = DEFAULT_STATE
@@ -168,18 +269,16 @@ class ClaudeBridge:
                 try:
                     self._callback(DEFAULT_STATE)
                 except Exception:
-                    pass
+                    logger.debug("Idle-timeout callback failed", exc_info=True)
 
-        # Clear our own ID since we're not rescheduling
-        self._idle_timeout_id = None
-        return False
+        return GLib.SOURCE_REMOVE
 
     def write_state(self, state: str) -> None:
         """Write a state to the file.  Useful for testing and internal use."""
         state = state.strip().lower()
         if state not in VALID_STATES:
             raise ValueError(
-                f"Invalid state '{state}'. Must be one of: {', '.join(sorted(VALID_STATES))}"
+                f"Invalid state '{state}'. Must be one of: {_VALID_STATES_SORTED}"
             )
 
         try:
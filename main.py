@@ -12,14 +12,6 @@ import os
 import signal
 import sys
 
-import gi
-
-gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk  # noqa: E402
-
-from claude_bridge import ClaudeBridge  # noqa: E402
-from pet_window import LABEL_HEIGHT, PetWindow  # noqa: E402
-
 logger = logging.getLogger("claude-pet")
 
 DEFAULT_SPRITES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sprites")
@@ -85,6 +77,8 @@ def setup_logging(debug: bool) -> None:
 
 def setup_signal_handlers() -> None:
     """Register SIGINT and SIGTERM to gracefully quit GTK."""
+    from gi.repository import Gtk
+
     def handle_signal(signum: int, frame: object) -> None:
         logger.info("Received signal %d, shutting down", signum)
         Gtk.main_quit()
@@ -93,22 +87,41 @@ def setup_signal_handlers() -> None:
     signal.signal(signal.SIGTERM, handle_signal)
 
 
+def _pid_alive(pid: int) -> bool:
+    """Return True if *pid* is a running process owned by this user."""
+    if sys.platform.startswith("linux"):
+        # One stat of /proc/<pid>, no signal permission check
+        try:
+            return os.stat(f"/proc/{pid}").st_uid == os.getuid()
+        except OSError:
+            return False
+    try:
+        os.kill(pid, 0)  # raises if process doesn't exist
+    except OSError:
+        return False
+    return True
+
+
 def check_single_instance(pid_file: str) -> None:
     """Exit if another instance is already running."""
     if os.path.exists(pid_file):
         try:
             with open(pid_file) as f:
                 pid = int(f.read().strip())
-            os.kill(pid, 0)  # raises if process doesn't exist
+        except (ValueError, OSError):
+            return  # stale or unreadable PID file, continue
+        if _pid_alive(pid):
             logger.info("Already running (PID %d), exiting", pid)
             sys.exit(0)
-        except (ValueError, ProcessLookupError, PermissionError, OSError):
-            pass  # stale PID file, continue
 
 
 def write_pid(pid_file: str) -> None:
-    with open(pid_file, "w") as f:
+    # Write-then-rename so a concurrent check_single_instance never sees
+    # an empty, half-written PID file
+    tmp = pid_file + ".tmp"
+    with open(tmp, "w") as f:
         f.write(str(os.getpid()))
+    os.replace(tmp, pid_file)
 
 
 def remove_pid(pid_file: str) -> None:
@@ -128,14 +141,26 @@ def load_config() -> dict:
 
 def save_config(cfg: dict) -> None:
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "w") as f:
         json.dump(cfg, f, indent=2)
+    os.replace(tmp, CONFIG_FILE)
 
 
 def main() -> None:
     args = parse_args()
     setup_logging(args.debug)
     check_single_instance(args.pid_file)
+
+    # GTK is only imported once we know this instance will actually run,
+    # keeping --help and the already-running exit path fast
+    import gi
+    gi.require_version("Gtk", "3.0")
+    from gi.repository import Gtk
+
+    from claude_bridge import ClaudeBridge
+    from pet_window import LABEL_HEIGHT, PetWindow
+
     setup_signal_handlers()
     write_pid(args.pid_file)
 
@@ -173,11 +198,12 @@ def main() -> None:
         if os.path.isdir(candidate):
             mascot_path = candidate
     if mascot_path is None:
-        for entry in sorted(os.listdir(DEFAULT_SPRITES_DIR)):
-            candidate = os.path.join(DEFAULT_SPRITES_DIR, entry)
-            if os.path.isdir(candidate):
-                mascot_path = candidate
-                break
+        # scandir's DirEntry.is_dir() uses the cached d_type, no stat per entry
+        with os.scandir(DEFAULT_SPRITES_DIR) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if entry.is_dir():
+                    mascot_path = entry.path
+                    break
     if mascot_path is None or not os.path.isdir(mascot_path):
         print("Error: No mascot found. Place a mascot in sprites/ or use --mascot <path>")
         print("See sprites/README.md for details.")
@@ -185,11 +211,11 @@ def main() -> None:
 
     from sprite_character import SpriteCharacter
     character = SpriteCharacter(mascot_path)
-    if not character._sprites:
+    if not character._sprite_paths:
         print(f"Error: No shime*.png sprites found in {mascot_path}")
         sys.exit(1)
     logger.info("Loaded mascot from %s (%d sprites)",
-                 mascot_path, len(character._sprites))
+                 mascot_path, len(character._sprite_paths))
 
     window = PetWindow(
         character=character,
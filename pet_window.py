@@ -8,10 +8,17 @@ Supports multi-monitor setups.
 
 from __future__ import annotations
 
+import bisect
+import ctypes
+import ctypes.util
 import enum
+import functools
+import itertools
 import logging
+import math
+import os
 import random
-import subprocess
+import time
 from typing import Protocol
 
 import cairo
@@ -21,17 +28,23 @@ gi.require_version("Gtk", "3.0")
 gi.require_version("Gdk", "3.0")
 from gi.repository import Gdk, GLib, Gtk  # noqa: E402
 
+from main import load_config, save_config  # noqa: E402
+from social_engine import SocialEngine  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
 class CharacterProto(Protocol):
     state: str
     frame: int
+    facing: int
+    move_state: str
     is_busy: bool
     def draw(self, ctx: cairo.Context, width: int, height: int) -> None: ...
-    def tick(self) -> None: ...
+    def tick(self, elapsed_ms: int | None = None) -> None: ...
     def set_state(self, state: str) -> None: ...
     def set_movement(self, move: str, facing: int) -> None: ...
+    def get_sprite(self, idx: int) -> cairo.ImageSurface | None: ...
 
 
 class ClaudeBridgeProto(Protocol):
@@ -41,29 +54,84 @@ class ClaudeBridgeProto(Protocol):
 
 
 FRAME_INTERVAL_MS = 1000 // 60
+IDLE_FRAME_INTERVAL_MS = 250  # frame timer while sitting idle (nothing animates)
 TEST_STATES = ("idle", "thinking", "working", "attention", "celebrating")
 SPRITE_BASE = 128  # Shimeji sprites are 128x128
 SCALE_OPTIONS = (0.5, 1.0, 1.5, 2.0)
 LABEL_HEIGHT = 20  # Extra height below sprite for project name label
 
+# Claude/animation states that freeze wander movement
+_SKIP_STATES = frozenset({
+    "working", "thinking", "error", "attention", "doubling",
+    "clone_frozen", "stumble", "celebrating", "attack",
+})
+
+# Bound once for WanderEngine's per-frame rolls and transitions; same
+# generator as the module-level random functions, minus the lookups.
+# randint()/uniform() are inlined as scaled _random() calls there.
+_random = random.random
+
 
 # ======================================================================
 # Movement state machine — Shimeji-style
 # ======================================================================
 
-class Move(enum.Enum):
-    WALK_GROUND = "walk_ground"
-    WALK_TOP = "walk_top"
-    CLIMB_LEFT = "climb_left"
-    CLIMB_RIGHT = "climb_right"
-    KICK = "kick"
-    JUMP = "jump"
-    FALL = "fall"
-    THROW = "throw"
-    BAD_LAND = "bad_land"
-    GOOD_LAND = "good_land"
-    HARD_LAND = "hard_land"
-    SIT = "sit"
+class Move(enum.IntEnum):
+    # Int-valued so per-frame comparisons and dispatch lookups use int
+    # hashing/equality instead of Enum's Python-level __hash__.
+    WALK_GROUND = enum.auto()
+    WALK_TOP = enum.auto()
+    CLIMB_LEFT = enum.auto()
+    CLIMB_RIGHT = enum.auto()
+    KICK = enum.auto()
+    JUMP = enum.auto()
+    FALL = enum.auto()
+    THROW = enum.auto()
+    BAD_LAND = enum.auto()
+    GOOD_LAND = enum.auto()
+    HARD_LAND = enum.auto()
+    SIT = enum.auto()
+
+
+# Weighted behavior name -> Move it starts.  Names not listed here
+# ("climb", "clone_kill", "error") are resolved by the caller.
+_BEHAVIOR_MOVES = {
+    "sit": Move.SIT,
+    "walk": Move.WALK_GROUND,
+    "kick": Move.KICK,
+    "jump": Move.JUMP,
+}
+
+
+def _build_weight_table(weights: dict[str, int],
+                        block_sit: bool) -> tuple[tuple, list[int], int]:
+    """Precompute (behaviors, cumulative weights, total) for bisect lookup."""
+    items = [(b, w) for b, w in weights.items() if not (block_sit and b == "sit")]
+    behaviors = tuple(_BEHAVIOR_MOVES.get(b, b) for b, _ in items)
+    cum = list(itertools.accumulate(w for _, w in items))
+    return behaviors, cum, cum[-1]
+
+
+# Physics tuning.  Module-level rather than WanderEngine class attributes
+# so the per-frame handlers read them as globals, not through self.
+_WALK_SPEED_MIN = 0.6        # px/frame @60fps
+_WALK_SPEED_MAX = 1.4        # px/frame @60fps
+_CLIMB_SPEED = 0.8           # px/frame @60fps (~48 px/sec)
+_FALL_SPEED_INIT = 1.5       # px/frame initial fall
+_FALL_ACCEL = 0.35           # px/frame² gravity @60fps (heavy)
+_FALL_SPEED_MAX = 8.0        # terminal velocity @60fps
+_THROW_GRAVITY = 0.30        # gravity during throw @60fps
+_THROW_FRICTION = 0.994      # horizontal drag per frame @60fps
+_JUMP_VY_SMALL = (-3.5, -5.0)   # small jump range
+_JUMP_VY_BIG = (-8.0, -11.0)   # big jump range
+_JUMP_VX_SMALL = 1.5            # horizontal push for small jumps
+_JUMP_VX_BIG = 7.0              # horizontal push for big jumps (wider arc)
+_JUMP_GRAVITY = 0.12            # gravity during jump
+
+_STUMBLE_CHANCE = 0.0003      # per frame while walking (~2% per second)
+_STUMBLE_CHANCE_CLOSE = 0.003  # per frame when another pet is very close (~16% per second)
+_FALL_CHANCE_TOP = 0.0008   # per-frame chance to fall while on ceiling
+_FALL_CHANCE_CLIMB = 0.0006  # per-frame chance to lose grip while climbing
 
 
 class WanderEngine:
@@ -78,27 +146,23 @@ class WanderEngine:
       - **active** (--debug): moves frequently, great for testing.
     """
 
-    WALK_SPEED_MIN = 0.6        # px/frame @60fps
-    WALK_SPEED_MAX = 1.4        # px/frame @60fps
-    CLIMB_SPEED = 0.8           # px/frame @60fps (~48 px/sec)
-    FALL_SPEED_INIT = 1.5       # px/frame initial fall
-    FALL_ACCEL = 0.35           # px/frame² gravity @60fps (heavy)
-    FALL_SPEED_MAX = 8.0        # terminal velocity @60fps
-    THROW_GRAVITY = 0.30        # gravity during throw @60fps
-    THROW_FRICTION = 0.994      # horizontal drag per frame @60fps
-    JUMP_VY_SMALL = (-3.5, -5.0)   # small jump range
-    JUMP_VY_BIG = (-8.0, -11.0)   # big jump range
-    JUMP_VX_SMALL = 1.5            # horizontal push for small jumps
-    JUMP_VX_BIG = 7.0              # horizontal push for big jumps (wider arc)
-    JUMP_GRAVITY = 0.12            # gravity during jump
+    __slots__ = (
+        "_monitors", "_pet_size", "_pet_height", "_margin", "_active_mode",
+        "_sit_range", "_walk_range",
+        "_social_block_sit", "_social_peer_nearby", "_active_idx",
+        "x_min", "x_max", "y_min", "y_max", "x", "y", "direction",
+        "move_state", "_sit_timer", "_walk_timer", "_walk_speed",
+        "_fall_speed", "_land_timer", "_throw_vx", "_throw_vy",
+        "_fall_start_y", "_jump_vx", "_jump_vy", "_jump_peak_y",
+        "pending_anim", "_weight_tables", "_dispatch",
+        "_xi", "_yi", "moved", "_bounds",
+    )
 
     # Behavior weights (higher = more likely to be chosen)
     #   sit:   stay put          walk:  walk on ground
     #   climb: climb nearest edge
     CALM_WEIGHTS   = {"sit": 200, "walk": 50, "climb": 10, "kick": 6, "jump": 2, "clone_kill": 2, "error": 2}
     ACTIVE_WEIGHTS = {"sit":  50, "walk": 150, "climb": 40, "kick": 18, "jump": 7, "clone_kill": 5, "error": 5}
-    STUMBLE_CHANCE = 0.0003      # per frame while walking (~2% per second)
-    STUMBLE_CHANCE_CLOSE = 0.003  # per frame when another pet is very close (~16% per second)
 
     # Sit durations (frames at 60 fps)
     CALM_SIT   = (600, 2400)   # 10–40 s
@@ -108,13 +172,11 @@ class WanderEngine:
     CALM_WALK   = (120, 360)   # 2–6 s
     ACTIVE_WALK = (240, 900)   # 4–15 s
 
-    FALL_CHANCE_TOP = 0.0008   # per-frame chance to fall while on ceiling
-
     def __init__(self, monitors: list[tuple[int, int, int, int]],
                  pet_size: int, pet_height: int | None = None,
                  margin: int = 2,
                  active: bool = False) -> None:
-        self._monitors = monitors
+        self._monitors = tuple(tuple(m) for m in monitors)
         self._pet_size = pet_size
         self._pet_height = pet_height or pet_size
         self._margin = margin
@@ -122,6 +184,14 @@ class WanderEngine:
         self._social_block_sit = False  # set by PetWindow from social directive
         self._social_peer_nearby = False  # True when another pet is very close
 
+        # (x_min, x_max, y_min, y_max) per monitor; size and margin are fixed
+        # for the engine's lifetime (a rescale builds a new engine)
+        self._bounds = tuple(
+            (mx + margin, mx + mw - pet_size - margin,
+             my + margin, my + mh - self._pet_height - margin)
+            for mx, my, mw, mh in self._monitors
+        )
+
         # Start on primary monitor (index 0)
         self._active_idx = 0
         self._update_bounds()
@@ -132,7 +202,7 @@ class WanderEngine:
         self.move_state = Move.SIT   # start sitting
         self._sit_timer = random.randint(300, 900)  # 5–15 s initial sit
         self._walk_timer = 0
-        self._walk_speed = random.uniform(self.WALK_SPEED_MIN, self.WALK_SPEED_MAX)
+        self._walk_speed = random.uniform(_WALK_SPEED_MIN, _WALK_SPEED_MAX)
         self._fall_speed = 0.0
         self._land_timer = 0
         self._throw_vx = 0.0
@@ -142,22 +212,61 @@ class WanderEngine:
         self._jump_vy = 0.0
         self._jump_peak_y = 0.0
         self.pending_anim: str | None = None
+        # Integer position returned by the last tick, and whether it changed
+        self._xi = int(self.x)
+        self._yi = int(self.y)
+        self.moved = False
+
+        # (active_mode, block_sit) -> (behaviors, cumulative weights, total)
+        self._weight_tables = {
+            (active, block_sit): _build_weight_table(
+                self.ACTIVE_WEIGHTS if active else self.CALM_WEIGHTS, block_sit)
+            for active in (False, True)
+            for block_sit in (False, True)
+        }
+
+        # Per-frame handler for each movement state
+        self._dispatch = {
+            Move.WALK_GROUND: self._do_walk_ground,
+            Move.WALK_TOP: self._do_walk_top,
+            Move.CLIMB_LEFT: self._do_climb_left,
+            Move.CLIMB_RIGHT: self._do_climb_right,
+            Move.KICK: functools.partial(self._do_projectile, self._land_kick),
+            Move.JUMP: functools.partial(self._do_projectile, self._land_jump),
+            Move.FALL: self._do_fall,
+            Move.THROW: self._do_throw,
+            Move.BAD_LAND: self._do_land,
+            Move.GOOD_LAND: self._do_land,
+            Move.HARD_LAND: self._do_land,
+            Move.SIT: self._do_sit,
+        }
 
     # --- active monitor ---
 
     def _update_bounds(self) -> None:
-        """Recalculate bounds from the active monitor."""
-        m = self._monitors[self._active_idx]
-        mx, my, mw, mh = m
-        self.x_min = mx + self._margin
-        self.x_max = mx + mw - self._pet_size - self._margin
-        self.y_min = my + self._margin
-        self.y_max = my + mh - self._pet_height - self._margin
+        """Load the active monitor's bounds."""
+        self.x_min, self.x_max, self.y_min, self.y_max = self._bounds[self._active_idx]
+
+    def set_position(self, x: float, y: float) -> None:
+        """Place the pet at (x, y), where the caller has put the window.
+
+        Resyncs the cached integer position so the next tick's ``moved``
+        compares against where the window really is.  Assign x/y directly
+        afterwards (e.g. a ground snap) and that tick reports the move.
+        """
+        self.x = x
+        self.y = y
+        self._xi = int(x)
+        self._yi = int(y)
 
     def set_active_monitor_at(self, x: float, y: float) -> None:
         """Switch active monitor to the one containing (x, y)."""
         cx = x + self._pet_size / 2
         cy = y + self._pet_size / 2
+        # Most drops land on the monitor we're already on
+        mx, my, mw, mh = self._monitors[self._active_idx]
+        if mx <= cx < mx + mw and my <= cy < my + mh:
+            return
         for i, m in enumerate(self._monitors):
             mx, my, mw, mh = m
             if mx <= cx < mx + mw and my <= cy < my + mh:
@@ -170,76 +279,69 @@ class WanderEngine:
     # --- behavior selection (Shimeji-style weighted random) ---
 
     def _pick_behavior(self, block_sit: bool = False) -> Move:
-        weights = dict(self.ACTIVE_WEIGHTS if self.active_mode else self.CALM_WEIGHTS)
-        if block_sit:
-            weights.pop("sit", None)
-        total = sum(weights.values())
-        roll = random.random() * total
-        cumulative = 0.0
-        for behavior, weight in weights.items():
-            cumulative += weight
-            if roll < cumulative:
-                if behavior == "sit":
-                    return Move.SIT
-                elif behavior == "walk":
-                    return Move.WALK_GROUND
-                elif behavior == "climb":
-                    # Only climb if near an edge
-                    if self.x <= self.x_min + 20:
-                        return Move.CLIMB_LEFT
-                    elif self.x >= self.x_max - 20:
-                        return Move.CLIMB_RIGHT
-                    return Move.WALK_GROUND  # not near edge, walk
-                elif behavior == "kick":
-                    return Move.KICK
-                elif behavior == "jump":
-                    return Move.JUMP
-                elif behavior in ("clone_kill", "error"):
-                    return behavior
-        return Move.SIT
-
-    def _sit_range(self) -> tuple[int, int]:
-        return self.ACTIVE_SIT if self.active_mode else self.CALM_SIT
-
-    def _walk_range(self) -> tuple[int, int]:
-        return self.ACTIVE_WALK if self.active_mode else self.CALM_WALK
+        behaviors, cum, total = self._weight_tables[(self._active_mode, block_sit)]
+        idx = bisect.bisect(cum, _random() * total)
+        if idx >= len(behaviors):
+            return Move.SIT
+        behavior = behaviors[idx]
+        if behavior == "climb":
+            # Only climb if near an edge
+            if self.x <= self.x_min + 20:
+                return Move.CLIMB_LEFT
+            elif self.x >= self.x_max - 20:
+                return Move.CLIMB_RIGHT
+            return Move.WALK_GROUND  # not near edge, walk
+        return behavior
+
+    @property
+    def active_mode(self) -> bool:
+        return self._active_mode
+
+    @active_mode.setter
+    def active_mode(self, active: bool) -> None:
+        # Sit/walk duration ranges only depend on the mode, so pick them here
+        # instead of on every transition.
+        self._active_mode = active
+        self._sit_range = self.ACTIVE_SIT if active else self.CALM_SIT
+        self._walk_range = self.ACTIVE_WALK if active else self.CALM_WALK
 
     # --- tick ---
 
-    def tick(self, anim_state: str) -> tuple[int, int]:
-        if anim_state in ("working", "thinking", "error", "attention",
-                          "doubling", "clone_frozen", "stumble",
-                          "celebrating", "attack"):
-            return int(self.x), int(self.y)
-
-        if self.move_state == Move.WALK_GROUND:
-            self._do_walk_ground()
-        elif self.move_state == Move.WALK_TOP:
-            self._do_walk_top()
-        elif self.move_state == Move.CLIMB_LEFT:
-            self._do_climb_left()
-        elif self.move_state == Move.CLIMB_RIGHT:
-            self._do_climb_right()
-        elif self.move_state == Move.KICK:
-            self._do_kick()
-        elif self.move_state == Move.JUMP:
-            self._do_jump()
-        elif self.move_state == Move.FALL:
-            self._do_fall()
-        elif self.move_state == Move.THROW:
-            self._do_throw()
-        elif self.move_state == Move.BAD_LAND:
-            self._do_land()
-        elif self.move_state == Move.GOOD_LAND:
-            self._do_land()
-        elif self.move_state == Move.HARD_LAND:
-            self._do_hard_land()
-        elif self.move_state == Move.SIT:
-            self._do_sit()
-
-        self.x = max(self.x_min, min(self.x, self.x_max))
-        self.y = max(self.y_min, min(self.y, self.y_max))
-        return int(self.x), int(self.y)
+    def tick(self, anim_state: str, frames: int = 1) -> tuple[int, int]:
+        """Advance one step.  frames > 1 is only passed while sitting idle on
+        the slow timer; the extra frames are counted off the sit timer.
+
+        Sets ``moved`` when the returned integer position differs from the
+        previous tick's, so the caller can skip redundant window moves.
+        Frozen states return the cached position without any work.
+        """
+        if anim_state in _SKIP_STATES:
+            self.moved = False
+            return self._xi, self._yi
+
+        if frames > 1 and self.move_state == Move.SIT:
+            self._sit_timer -= frames - 1
+        self._dispatch[self.move_state]()
+
+        # Clamp to the active monitor with locals instead of min()/max() calls
+        x = self.x
+        y = self.y
+        if x > self.x_max:
+            x = self.x_max
+        if x < self.x_min:
+            x = self.x_min
+        if y > self.y_max:
+            y = self.y_max
+        if y < self.y_min:
+            y = self.y_min
+        self.x = x
+        self.y = y
+        xi = int(x)
+        yi = int(y)
+        self.moved = xi != self._xi or yi != self._yi
+        self._xi = xi
+        self._yi = yi
+        return xi, yi
 
     # --- movement states ---
 
@@ -248,8 +350,8 @@ class WanderEngine:
         self.x += self._walk_speed * self.direction
 
         # Random stumble while walking (more likely when another pet is very close)
-        chance = self.STUMBLE_CHANCE_CLOSE if self._social_peer_nearby else self.STUMBLE_CHANCE
-        if random.random() < chance:
+        chance = _STUMBLE_CHANCE_CLOSE if self._social_peer_nearby else _STUMBLE_CHANCE
+        if _random() < chance:
             self.pending_anim = "stumble"
             self._start_sit()
             return
@@ -279,7 +381,7 @@ class WanderEngine:
             self.x = self.x_max
             self.direction = -1
 
-        if random.random() < self.FALL_CHANCE_TOP:
+        if _random() < _FALL_CHANCE_TOP:
             self._start_fall()
 
         self._walk_timer -= 1
@@ -288,30 +390,30 @@ class WanderEngine:
 
     def _do_climb_left(self) -> None:
         self.x = self.x_min
-        self.y -= self.CLIMB_SPEED
+        self.y -= _CLIMB_SPEED
         if self.y <= self.y_min:
             self.y = self.y_min
             self.direction = 1
             self.move_state = Move.WALK_TOP
-            lo, hi = self._walk_range()
-            self._walk_timer = random.randint(lo, hi)
-        if random.random() < 0.0006:
+            lo, hi = self._walk_range
+            self._walk_timer = lo + int(_random() * (hi - lo + 1))
+        if _random() < _FALL_CHANCE_CLIMB:
             self._start_fall()
 
     def _do_climb_right(self) -> None:
         self.x = self.x_max
-        self.y -= self.CLIMB_SPEED
+        self.y -= _CLIMB_SPEED
         if self.y <= self.y_min:
             self.y = self.y_min
             self.direction = -1
             self.move_state = Move.WALK_TOP
-            lo, hi = self._walk_range()
-            self._walk_timer = random.randint(lo, hi)
-        if random.random() < 0.0006:
+            lo, hi = self._walk_range
+            self._walk_timer = lo + int(_random() * (hi - lo + 1))
+        if _random() < _FALL_CHANCE_CLIMB:
             self._start_fall()
 
     def _do_fall(self) -> None:
-        self._fall_speed = min(self._fall_speed + self.FALL_ACCEL, self.FALL_SPEED_MAX)
+        self._fall_speed = min(self._fall_speed + _FALL_ACCEL, _FALL_SPEED_MAX)
         self.y += self._fall_speed
         if self.y >= self.y_max:
             self.y = self.y_max
@@ -334,13 +436,7 @@ class WanderEngine:
         self._land_timer -= 1
         if self._land_timer <= 0:
             self.move_state = Move.SIT
-            self._sit_timer = random.randint(60, 120)  # 1–2 seconds
-
-    def _do_hard_land(self) -> None:
-        self._land_timer -= 1
-        if self._land_timer <= 0:
-            self.move_state = Move.SIT
-            self._sit_timer = random.randint(60, 120)
+            self._sit_timer = 60 + int(_random() * 61)  # 1–2 seconds
 
     def _do_sit(self) -> None:
         self._sit_timer -= 1
@@ -370,60 +466,54 @@ class WanderEngine:
 
     def _start_sit(self) -> None:
         self.move_state = Move.SIT
-        lo, hi = self._sit_range()
-        self._sit_timer = random.randint(lo, hi)
+        lo, hi = self._sit_range
+        self._sit_timer = lo + int(_random() * (hi - lo + 1))
 
     def _start_walk(self) -> None:
         self.move_state = Move.WALK_GROUND
-        self.direction = random.choice([-1, 1])
-        self._walk_speed = random.uniform(self.WALK_SPEED_MIN, self.WALK_SPEED_MAX)
-        lo, hi = self._walk_range()
-        self._walk_timer = random.randint(lo, hi)
+        self.direction = 1 if _random() < 0.5 else -1
+        vmin, vmax = _WALK_SPEED_MIN, _WALK_SPEED_MAX
+        self._walk_speed = vmin + (vmax - vmin) * _random()
+        lo, hi = self._walk_range
+        self._walk_timer = lo + int(_random() * (hi - lo + 1))
 
     def _start_kick(self) -> None:
         self.move_state = Move.KICK
-        vy = random.uniform(*self.JUMP_VY_SMALL)
-        vx = self.JUMP_VX_SMALL
+        vy_a, vy_b = _JUMP_VY_SMALL
+        vy = vy_a + (vy_b - vy_a) * _random()
+        vx = _JUMP_VX_SMALL
         self._jump_vx = vx * self.direction
         self._jump_vy = vy
         self._jump_peak_y = self.y
         self._fall_start_y = self.y
 
-    def _do_kick(self) -> None:
-        self._jump_vy += self.JUMP_GRAVITY
-        self.x += self._jump_vx
-        self.y += self._jump_vy
-
-        if self.y < self._jump_peak_y:
-            self._jump_peak_y = self.y
-
-        if self.y >= self.y_max:
-            self.y = self.y_max
-            self.move_state = Move.GOOD_LAND
-            self._land_timer = 30
-            return
-
-        if self.x <= self.x_min:
-            self.x = self.x_min
-            self.move_state = Move.CLIMB_LEFT
-            return
-
-        if self.x >= self.x_max:
-            self.x = self.x_max
-            self.move_state = Move.CLIMB_RIGHT
-            return
-
     def _start_jump(self) -> None:
         self.move_state = Move.JUMP
-        vy = random.uniform(*self.JUMP_VY_BIG)
-        vx = self.JUMP_VX_BIG
+        vy_a, vy_b = _JUMP_VY_BIG
+        vy = vy_a + (vy_b - vy_a) * _random()
+        vx = _JUMP_VX_BIG
         self._jump_vx = vx * self.direction
         self._jump_vy = vy
         self._jump_peak_y = self.y
         self._fall_start_y = self.y
 
-    def _do_jump(self) -> None:
-        self._jump_vy += self.JUMP_GRAVITY
+    def _land_kick(self) -> None:
+        self.move_state = Move.GOOD_LAND
+        self._land_timer = 30
+
+    def _land_jump(self) -> None:
+        if _random() < 0.5:
+            # Nailed the landing — hold standing pose before next behavior
+            self.move_state = Move.GOOD_LAND
+            self._land_timer = 40
+        else:
+            # Faceplant
+            self._fall_start_y = self._jump_peak_y
+            self._land_from_fall()
+
+    def _do_projectile(self, land_fn) -> None:
+        """Shared kick/jump arc; only the ground landing differs."""
+        self._jump_vy += _JUMP_GRAVITY
         self.x += self._jump_vx
         self.y += self._jump_vy
 
@@ -433,14 +523,7 @@ class WanderEngine:
         # Hit ground?
         if self.y >= self.y_max:
             self.y = self.y_max
-            if random.random() < 0.5:
-                # Nailed the landing — hold standing pose before next behavior
-                self.move_state = Move.GOOD_LAND
-                self._land_timer = 40
-            else:
-                # Faceplant
-                self._fall_start_y = self._jump_peak_y
-                self._land_from_fall()
+            land_fn()
             return
 
         # Hit left wall? Stick and climb!
@@ -460,13 +543,13 @@ class WanderEngine:
             self.y = self.y_min
             self.direction = 1 if self._jump_vx > 0 else -1
             self.move_state = Move.WALK_TOP
-            lo, hi = self._walk_range()
-            self._walk_timer = random.randint(lo, hi)
+            lo, hi = self._walk_range
+            self._walk_timer = lo + int(_random() * (hi - lo + 1))
             return
 
     def _start_fall(self) -> None:
         self.move_state = Move.FALL
-        self._fall_speed = self.FALL_SPEED_INIT
+        self._fall_speed = _FALL_SPEED_INIT
         self._fall_start_y = self.y
 
     def _start_throw(self, vx: float, vy: float) -> None:
@@ -477,8 +560,8 @@ class WanderEngine:
         self._fall_start_y = self.y
 
     def _do_throw(self) -> None:
-        self._throw_vy += self.THROW_GRAVITY
-        self._throw_vx *= self.THROW_FRICTION
+        self._throw_vy += _THROW_GRAVITY
+        self._throw_vx *= _THROW_FRICTION
         self.x += self._throw_vx
         self.y += self._throw_vy
 
@@ -493,8 +576,8 @@ class WanderEngine:
             self.y = self.y_min
             self.direction = 1 if self._throw_vx > 0 else -1
             self.move_state = Move.WALK_TOP
-            lo, hi = self._walk_range()
-            self._walk_timer = random.randint(lo, hi)
+            lo, hi = self._walk_range
+            self._walk_timer = lo + int(_random() * (hi - lo + 1))
             return
 
         # Hit left wall? Stick and climb!
@@ -511,28 +594,156 @@ class WanderEngine:
 
         # Horizontal velocity died out? Just fall
         if abs(self._throw_vx) < 0.06:
-            self._fall_speed = max(self._throw_vy, self.FALL_SPEED_INIT)
+            self._fall_speed = max(self._throw_vy, _FALL_SPEED_INIT)
             self.move_state = Move.FALL
 
 
+# ======================================================================
+# Compositor shadow opt-out (_COMPTON_SHADOW=0)
+# ======================================================================
+
+_XA_CARDINAL = 6          # predefined atom, X.h
+_PROP_MODE_REPLACE = 0
+
+# (libX11, Display*, _COMPTON_SHADOW atom) once opened, False if unavailable
+_x11: tuple | bool | None = None
+
+
+class _XErrorEvent(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_int),
+        ("display", ctypes.c_void_p),
+        ("resourceid", ctypes.c_ulong),
+        ("serial", ctypes.c_ulong),
+        ("error_code", ctypes.c_ubyte),
+        ("request_code", ctypes.c_ubyte),
+        ("minor_code", ctypes.c_ubyte),
+    ]
+
+
+_XErrorHandler = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(_XErrorEvent))
+# Keep the ctypes callbacks alive for as long as Xlib may call them
+_x11_error_handlers: list = []
+
+
+def _install_x11_error_handler(lib: ctypes.CDLL, dpy: int) -> None:
+    """Log and ignore X errors on our private connection.
+
+    Xlib's default handler exit()s the process.  The handler is
+    process-wide, so errors on any other connection (GDK's) are passed
+    on to whatever handler was installed before.
+    """
+    lib.XSetErrorHandler.argtypes = [_XErrorHandler]
+    lib.XSetErrorHandler.restype = ctypes.c_void_p
+    prev = None
+
+    def handler(display, event):
+        if display == dpy:
+            ev = event.contents
+            logger.debug("Ignoring X error %d (request %d) on xid %d",
+                         ev.error_code, ev.request_code, ev.resourceid)
+            return 0
+        return prev(display, event) if prev else 0
+
+    cb = _XErrorHandler(handler)
+    _x11_error_handlers.append(cb)
+    old = lib.XSetErrorHandler(cb)
+    prev = _XErrorHandler(old) if old else None
+
+
+def _x11_handle() -> tuple | None:
+    """Open a private Xlib connection on first use and cache it."""
+    global _x11
+    if _x11 is None:
+        _x11 = False
+        try:
+            lib = ctypes.CDLL(ctypes.util.find_library("X11") or "libX11.so.6")
+            lib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+            lib.XOpenDisplay.restype = ctypes.c_void_p
+            lib.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+            lib.XInternAtom.restype = ctypes.c_ulong
+            lib.XChangeProperty.argtypes = [
+                ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong,
+                ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_int,
+            ]
+            lib.XFlush.argtypes = [ctypes.c_void_p]
+            dpy = lib.XOpenDisplay(None)
+            if dpy:
+                _install_x11_error_handler(lib, dpy)
+                atom = lib.XInternAtom(dpy, b"_COMPTON_SHADOW", 0)
+                _x11 = (lib, dpy, atom)
+        except (OSError, AttributeError):
+            logger.debug("libX11 not available, falling back to xprop")
+    return _x11 or None
+
+
+def _disable_compositor_shadow(xid: int) -> None:
+    """Set _COMPTON_SHADOW=0 on an X window so picom skips its shadow.
+
+    Uses libX11 directly (one cached connection for the whole process);
+    spawns xprop only if libX11 can't be loaded, through GLib so the
+    (sprite-heavy) Python process isn't forked through subprocess and
+    the child is reaped automatically.
+
+    Either way the property is set over a different X connection than
+    GDK's, so GDK's connection is synced first: otherwise its
+    CreateWindow for xid may still be buffered when the change arrives.
+    """
+    display = Gdk.Display.get_default()
+    if display is not None:
+        display.sync()
+    handle = _x11_handle()
+    if handle is not None:
+        lib, dpy, atom = handle
+        data = (ctypes.c_long * 1)(0)  # format-32 data is an array of C longs
+        lib.XChangeProperty(dpy, xid, atom, _XA_CARDINAL, 32,
+                            _PROP_MODE_REPLACE, data, 1)
+        lib.XFlush(dpy)
+        return
+    GLib.spawn_async(
+        ["xprop", "-id", str(xid),
+         "-f", "_COMPTON_SHADOW", "32c",
+         "-set", "_COMPTON_SHADOW", "0"],
+        flags=(GLib.SpawnFlags.SEARCH_PATH
+               | GLib.SpawnFlags.STDOUT_TO_DEV_NULL
+               | GLib.SpawnFlags.STDERR_TO_DEV_NULL),
+    )
+
+
+_rgba: Gdk.Visual | bool | None = None
+
+
+def _rgba_visual(screen: Gdk.Screen) -> Gdk.Visual | None:
+    """The screen's RGBA visual, looked up once and shared by every window."""
+    global _rgba
+    if _rgba is None:
+        _rgba = screen.get_rgba_visual() or False
+    return _rgba or None
+
+
 # ======================================================================
 # Clone window (temporary sprite overlay for clone-kill animation)
 # ======================================================================
 
 class CloneWindow(Gtk.Window):
-    """Lightweight temporary window that plays a sprite animation and calls back."""
+    """Lightweight temporary window that plays a sprite animation and calls back.
 
-    def __init__(self, sprites: dict, indices: list[int], delay: int,
+    It has no timer of its own: the owner advances it from its frame tick
+    with tick(elapsed_ms), so the clone costs no extra wakeups.
+
+    Get one with spawn() and hand it back with release(): released windows
+    are hidden and reused, since creating and realizing a new POPUP (plus
+    the compositor setup for it) costs far more than re-showing one.
+    """
+
+    _pool: list[CloneWindow] = []
+
+    def __init__(self, get_sprite: callable, indices: list[int], delay: int,
                  size: int, x: int, y: int, facing: int,
                  on_done: callable) -> None:
         super().__init__(type=Gtk.WindowType.POPUP)
-        self._sprites = sprites
-        self._indices = indices
-        self._delay = delay
         self._size = size
-        self._facing = facing
-        self._frame = 0
-        self._on_done = on_done
 
         self.set_default_size(size, size)
         self.set_resizable(False)
@@ -542,8 +753,7 @@ class CloneWindow(Gtk.Window):
         self.set_skip_taskbar_hint(True)
         self.set_skip_pager_hint(True)
 
-        screen = self.get_screen()
-        visual = screen.get_rgba_visual()
+        visual = _rgba_visual(self.get_screen())
         if visual:
             self.set_visual(visual)
         self.set_app_paintable(True)
@@ -555,65 +765,156 @@ class CloneWindow(Gtk.Window):
 
         self.set_type_hint(Gdk.WindowTypeHint.DOCK)
         self.connect("realize", self._on_realize)
+        self._start(get_sprite, indices, delay, size, x, y, facing, on_done)
+
+    @classmethod
+    def spawn(cls, get_sprite: callable, indices: list[int], delay: int,
+              size: int, x: int, y: int, facing: int,
+              on_done: callable) -> CloneWindow:
+        """Play a sequence in a pooled window, creating one if none is free."""
+        if cls._pool:
+            win = cls._pool.pop()
+            win._start(get_sprite, indices, delay, size, x, y, facing, on_done)
+            return win
+        return cls(get_sprite, indices, delay, size, x, y, facing, on_done)
+
+    def release(self) -> None:
+        """Hide the window and return it to the pool for the next spawn()."""
+        self.hide()
+        self._on_done = None
+        self._frames = [None]  # drop the baked surfaces until the next start
+        self._n_frames = 1
+        CloneWindow._pool.append(self)
+
+    def _start(self, get_sprite: callable, indices: list[int], delay: int,
+               size: int, x: int, y: int, facing: int,
+               on_done: callable) -> None:
+        self._delay = delay
+        self._facing = facing
+        self._frame = 0
+        self._elapsed = 0  # ms into the current frame
+        self._on_done = on_done
+        if size != self._size:
+            self._size = size
+            self._da.set_size_request(size, size)
+            # Window-level request forces a non-resizable window to shrink
+            self.set_size_request(size, size)
+        # Resolve the sequence to surfaces once, pre-scaled and pre-flipped
+        # to the window size (None for missing sprites).  Repeated indices
+        # share one baked surface.
+        baked: dict[int, cairo.ImageSurface | None] = {}
+        for i in indices:
+            if i not in baked:
+                baked[i] = self._bake(get_sprite(i))
+        self._frames = [baked[i] for i in indices]
+        self._n_frames = len(self._frames)
+
         self.move(x, y)
         self.show_all()
-        self._timer = GLib.timeout_add(delay, self._tick)
 
     def _on_realize(self, widget: Gtk.Window) -> None:
         try:
-            xid = self.get_window().get_xid()
-            subprocess.Popen(
-                ["xprop", "-id", str(xid),
-                 "-f", "_COMPTON_SHADOW", "32c",
-                 "-set", "_COMPTON_SHADOW", "0"],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
+            _disable_compositor_shadow(self.get_window().get_xid())
         except Exception:
             pass
 
-    def _on_draw(self, widget: Gtk.DrawingArea, ctx: cairo.Context) -> bool:
-        ctx.set_operator(cairo.OPERATOR_SOURCE)
-        ctx.set_source_rgba(0, 0, 0, 0)
+    def _bake(self, sprite: cairo.ImageSurface | None) -> cairo.ImageSurface | None:
+        """Render a sprite scaled to the window size and flipped for facing."""
+        if sprite is None:
+            return None
+        size = self._size
+        sx = size / sprite.get_width()
+        sy = size / sprite.get_height()
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
+        ctx = cairo.Context(surface)
+        if self._facing > 0:
+            ctx.transform(cairo.Matrix(-sx, 0, 0, sy, size, 0))
+        else:
+            ctx.scale(sx, sy)
+        ctx.set_source_surface(sprite, 0, 0)
+        ctx.get_source().set_filter(cairo.FILTER_NEAREST)
         ctx.paint()
-        ctx.set_operator(cairo.OPERATOR_OVER)
+        return surface
 
-        idx = self._indices[self._frame % len(self._indices)]
-        surface = self._sprites.get(idx)
+    def _on_draw(self, widget: Gtk.DrawingArea, ctx: cairo.Context) -> bool:
+        surface = self._frames[self._frame % self._n_frames]
         if surface is None:
+            ctx.set_operator(cairo.OPERATOR_CLEAR)
+            ctx.paint()
             return True
-
-        w = widget.get_allocated_width()
-        h = widget.get_allocated_height()
-        sw = surface.get_width()
-        sh = surface.get_height()
-
-        ctx.save()
-        sx = w / sw
-        sy = h / sh
-        if self._facing > 0:
-            ctx.translate(w, 0)
-            ctx.scale(-sx, sy)
-        else:
-            ctx.scale(sx, sy)
+        # SOURCE replaces every pixel (transparent outside the sprite), so
+        # no separate clear is needed
+        ctx.set_operator(cairo.OPERATOR_SOURCE)
         ctx.set_source_surface(surface, 0, 0)
-        ctx.get_source().set_filter(cairo.FILTER_NEAREST)
         ctx.paint()
-        ctx.restore()
         return True
 
-    def _tick(self) -> bool:
-        self._frame += 1
-        if self._frame >= len(self._indices):
-            self._on_done(self)
-            return False
-        self._da.queue_draw()
-        return True
+    def tick(self, elapsed_ms: int) -> None:
+        """Advance the sequence; calls on_done once after the last frame,
+        leaving that frame on screen."""
+        if self._on_done is None:
+            return  # finished (or released)
+        elapsed = self._elapsed + elapsed_ms
+        if elapsed < self._delay:
+            self._elapsed = elapsed
+            return
+        steps, self._elapsed = divmod(elapsed, self._delay)
+        frame = self._frame + steps
+        if frame >= self._n_frames:
+            on_done = self._on_done
+            self._on_done = None
+            on_done(self)
+            return
+        # Sequences often hold a sprite for several frames; only redraw
+        # when the image actually changes.
+        if self._frames[frame] is not self._frames[self._frame]:
+            self._da.queue_draw()
+        self._frame = frame
 
 
 # ======================================================================
 # Main window
 # ======================================================================
 
+# Drag sprite by pendulum swing speed: below 0.2 neutral, then slow/fast/
+# very fast at 0.6 and 1.5 (there's no very-fast right sprite)
+_DRAG_SWING_THRESHOLDS = (0.2, 0.6, 1.5)
+_DRAG_MOVES_LEFT = ("drag", "drag_left_slow", "drag_left_fast", "drag_left_vfast")
+_DRAG_MOVES_RIGHT = ("drag", "drag_right_slow", "drag_right_fast", "drag_right_fast")
+
+# Sprite offset inside the window for moves not in PetWindow._offset_table
+_NO_OFFSET = (0, 0, True)  # (offset_x, offset_y, label_on_top)
+
+# Wander state -> character movement animation
+_MOVE_NAME_MAP = {
+    Move.WALK_GROUND: "walk",
+    Move.WALK_TOP: "ceiling",
+    Move.CLIMB_LEFT: "climb",
+    Move.CLIMB_RIGHT: "climb",
+    Move.FALL: "fall",
+    Move.THROW: "fall",
+    Move.BAD_LAND: "bad_land",
+    Move.GOOD_LAND: "good_land",
+    Move.HARD_LAND: "hard_land",
+    Move.SIT: "sit",
+    Move.KICK: "kick",
+    Move.JUMP: "jump_launch",
+}
+
+# Wander state -> move name published to peers via the social position file
+_SOCIAL_POS_MOVE_NAMES = {
+    Move.SIT: "sit", Move.WALK_GROUND: "walk",
+    Move.WALK_TOP: "walk", Move.CLIMB_LEFT: "climb",
+    Move.CLIMB_RIGHT: "climb", Move.FALL: "fall",
+    Move.THROW: "fall",
+}
+
+# Wander state -> move name the social engine decides on (ground states only)
+_SOCIAL_TICK_MOVE_NAMES = {
+    Move.SIT: "sit", Move.WALK_GROUND: "walk",
+    Move.WALK_TOP: "walk",
+}
+
 class PetWindow(Gtk.Window):
     """Transparent floating pet window for X11/i3.
 
@@ -660,17 +961,41 @@ class PetWindow(Gtk.Window):
         # animation finishes (non-looping) or user picks "Auto".
         self._manual_override = False
         self._menu_timeout_id: int | None = None
+        self._cfg_save_id: int | None = None  # pending mascot config write
         self._wander_anim_timer_id: int | None = None
 
         self._frame_timer_id: int | None = None
+        self._frame_tick_id: int | None = None  # frame-clock callback at full rate
+        self._frame_sleeping = False  # no frame armed until _wake_frame_timer()
+        self._frame_interval_ms: int = FRAME_INTERVAL_MS
+        self._frame_credit_ms: int = 0  # idle time cut short by a wake, see _on_frame_tick
+        self._next_frame_at: float = 0.0  # monotonic deadline of the next frame
+        self._drawn_layout: tuple | None = None  # offsets/label side/size last queued
+        self._last_render_sig: tuple | None = None  # skip redraws of identical frames
+        # Unmapped (hide/withdraw) or fully obscured -> skip queueing draws
+        self._withdrawn = False
+        self._obscured = False
+        self._visible = True
+        self._ctx_menu: Gtk.Menu | None = None  # built on first right-click
+        self._ctx_menu_items: dict = {}
+        self._ctx_menu_mtime = 0
+        self._monitor_cache: list[tuple[int, int, int, int]] | None = None
         self._wander: WanderEngine | None = None
         self._draw_offset_x: int = 0
         self._draw_offset_y: int = 0
         self._label_on_top: bool = True
+        self._offset_table: dict[Move, tuple[int, int, bool]] = {}
+        self._build_offset_table()
         self._clone_window: CloneWindow | None = None
         self._clone_falling: bool = False
+        self._clone_death_ms: int | None = None  # ms until the clone takes over
         self._last_social_directive = None
         self._pending_throw: tuple[float, float] | None = None
+        self._pending_motion: tuple[float, float] | None = None  # latest drag pointer pos
+        self._pending_bridge_state: str | None = None  # latest undelivered bridge state
+        # Pre-rendered project label, built on first draw (the name is fixed)
+        self._label_surface: cairo.ImageSurface | None = None
+        self._label_extents = None
 
         self._setup_window()
         self._setup_drawing()
@@ -694,22 +1019,46 @@ class PetWindow(Gtk.Window):
         self.set_skip_pager_hint(True)
 
         screen = self.get_screen()
-        visual = screen.get_rgba_visual()
+        visual = _rgba_visual(screen)
         if visual is not None:
             self.set_visual(visual)
             logger.debug("RGBA visual enabled")
         else:
             logger.warning("RGBA visual not available")
+        screen.connect("monitors-changed", self._on_monitors_changed)
 
         self.set_app_paintable(True)
         self.set_type_hint(Gdk.WindowTypeHint.DOCK)
         self.connect("realize", self._on_realize)
         self.connect("destroy", self._on_destroy)
+        self.connect("window-state-event", self._on_window_state)
+        self.connect("visibility-notify-event", self._on_visibility)
+
+    def _on_window_state(self, widget: Gtk.Window, event: Gdk.EventWindowState) -> bool:
+        self._withdrawn = bool(event.new_window_state & Gdk.WindowState.WITHDRAWN)
+        self._update_visible()
+        return False
+
+    def _on_visibility(self, widget: Gtk.Window, event: Gdk.EventVisibility) -> bool:
+        # Only delivered without a compositor; composited windows never
+        # report themselves obscured
+        self._obscured = event.state == Gdk.VisibilityState.FULLY_OBSCURED
+        self._update_visible()
+        return False
+
+    def _update_visible(self) -> None:
+        visible = not (self._withdrawn or self._obscured)
+        if visible and not self._visible:
+            # Frames were skipped while hidden; repaint everything
+            self._last_render_sig = None
+            self._drawn_layout = None
+        self._visible = visible
 
     def _setup_drawing(self) -> None:
         self._drawing_area = Gtk.DrawingArea()
         self._drawing_area.set_size_request(self._size, self._size + self._label_height)
         self._drawing_area.connect("draw", self._on_draw)
+        self._drawing_area.connect_after("unmap", self._on_drawing_unmap)
         self.add(self._drawing_area)
 
     def _setup_input(self) -> None:
@@ -717,19 +1066,29 @@ class PetWindow(Gtk.Window):
             Gdk.EventMask.BUTTON_PRESS_MASK
             | Gdk.EventMask.BUTTON_RELEASE_MASK
             | Gdk.EventMask.POINTER_MOTION_MASK
+            | Gdk.EventMask.VISIBILITY_NOTIFY_MASK
         )
         self.connect("button-press-event", self._on_button_press)
         self.connect("button-release-event", self._on_button_release)
         self.connect("motion-notify-event", self._on_motion)
 
     def _get_monitor_geometries(self) -> list[tuple[int, int, int, int]]:
-        """Get (x, y, width, height) for every connected monitor."""
-        screen = self.get_screen()
-        monitors = []
-        for i in range(screen.get_n_monitors()):
-            g = screen.get_monitor_geometry(i)
-            monitors.append((g.x, g.y, g.width, g.height))
-        return monitors
+        """Get (x, y, width, height) for every connected monitor.
+
+        Each geometry lookup is an X roundtrip, so the list is cached
+        until the screen reports a monitor change.
+        """
+        if self._monitor_cache is None:
+            screen = self.get_screen()
+            monitors = []
+            for i in range(screen.get_n_monitors()):
+                g = screen.get_monitor_geometry(i)
+                monitors.append((g.x, g.y, g.width, g.height))
+            self._monitor_cache = monitors
+        return self._monitor_cache
+
+    def _on_monitors_changed(self, screen: Gdk.Screen) -> None:
+        self._monitor_cache = None
 
     def _get_primary_monitor_geometry(self) -> Gdk.Rectangle:
         screen = self.get_screen()
@@ -764,10 +1123,8 @@ class PetWindow(Gtk.Window):
                       self._wander.x_min, self._wander.y_min,
                       self._wander.x_max, self._wander.y_max)
         win_x, win_y = self.get_position()
-        self._wander.x = float(win_x)
-        self._wander.y = float(win_y)
         # Snap to ground so we don't start floating
-        self._wander.y = self._wander.y_max
+        self._wander.set_position(float(win_x), self._wander.y_max)
         self.move(int(self._wander.x), int(self._wander.y))
 
     # ------------------------------------------------------------------
@@ -775,116 +1132,256 @@ class PetWindow(Gtk.Window):
     # ------------------------------------------------------------------
 
     def _start_timers(self) -> None:
-        self._frame_timer_id = GLib.timeout_add(FRAME_INTERVAL_MS, self._on_frame_tick)
+        self._frame_interval_ms = FRAME_INTERVAL_MS
+        self._next_frame_at = time.monotonic()
+        self._schedule_frame()
+
+    def _schedule_frame(self) -> None:
+        """Arm the next frame.
+
+        At full rate on a mapped window, frames are driven by the drawing
+        area's frame clock so they land on the compositor's refresh instead
+        of beating against it.  Otherwise (idle rate, or not mapped, where
+        the frame clock doesn't run) a one-shot timer is armed for the next
+        deadline.
+
+        Timer deadlines step by the frame interval from the previous deadline,
+        not from when the tick returned, so tick work doesn't add drift.
+        After an overrun the grid restarts from now instead of bursting
+        to catch up.
+        """
+        if (self._frame_interval_ms == FRAME_INTERVAL_MS
+                and self._drawing_area.get_mapped()):
+            self._next_frame_at = 0.0  # frame-clock time; first callback steps
+            self._frame_tick_id = self._drawing_area.add_tick_callback(
+                self._on_frame_clock)
+            return
+        interval = self._frame_interval_ms / 1000
+        now = time.monotonic()
+        deadline = self._next_frame_at + interval
+        if deadline <= now:
+            deadline = now + interval
+        self._next_frame_at = deadline
+        delay_ms = max(1, int((deadline - now) * 1000))
+        self._frame_timer_id = GLib.timeout_add(delay_ms, self._on_frame_timer)
+
+    def _wake_frame_timer(self) -> None:
+        """Return to the full frame rate right away (input, state change)."""
+        if self._frame_sleeping:
+            self._frame_sleeping = False
+        elif self._frame_timer_id is None or self._frame_interval_ms == FRAME_INTERVAL_MS:
+            return
+        else:
+            GLib.source_remove(self._frame_timer_id)
+            # Full rate may move to the frame clock, which never sets the id
+            self._frame_timer_id = None
+            # The cancelled idle frame would have covered the time since the
+            # last tick (one interval before its deadline); hand that time
+            # to the next tick so sit timers and animations don't stretch
+            now = time.monotonic()
+            last_tick = self._next_frame_at - self._frame_interval_ms / 1000
+            self._frame_credit_ms = max(0, int((now - last_tick) * 1000))
+        self._frame_interval_ms = FRAME_INTERVAL_MS
+        self._next_frame_at = time.monotonic()
+        self._schedule_frame()
+
+    def _is_quiescent(self) -> bool:
+        """True when nothing on screen can change between frames: idle and
+        sitting still, with no drag, clone or fight pending."""
+        if (self._drag_active or self._clone_falling
+                or self._clone_window is not None
+                or self._pending_throw is not None
+                or self.character.state != "idle"):
+            return False
+        if self._wander is None:
+            return True
+        # Other move states animate even with wander off (e.g. walk in place)
+        return self._wander.move_state == Move.SIT and not self._wander.pending_anim
+
+    def _idle_interval_ms(self) -> int | None:
+        """How long a quiescent pet can go without a frame, or None if
+        nothing will change until something wakes it."""
+        if self._social:
+            return IDLE_FRAME_INTERVAL_MS  # peers are read and answered continuously
+        wander = self._wander
+        if wander is None or not self._wander_enabled:
+            return None  # input, bridge states and menu actions wake it
+        # A lone sitting pet has nothing to do until its sit timer runs out
+        return max(IDLE_FRAME_INTERVAL_MS, wander._sit_timer * FRAME_INTERVAL_MS)
+
+    def _reschedule_frame(self) -> None:
+        """Arm the next frame at the rate the current state needs."""
+        if self._is_quiescent():
+            interval = self._idle_interval_ms()
+            if interval is None:
+                self._frame_sleeping = True
+                return
+            self._frame_interval_ms = interval
+        else:
+            self._frame_interval_ms = FRAME_INTERVAL_MS
+        self._schedule_frame()
 
     def _stop_timers(self) -> None:
+        self._frame_sleeping = False
         if self._frame_timer_id is not None:
             GLib.source_remove(self._frame_timer_id)
             self._frame_timer_id = None
+        if self._frame_tick_id is not None:
+            self._drawing_area.remove_tick_callback(self._frame_tick_id)
+            self._frame_tick_id = None
 
-    def _on_frame_tick(self) -> bool:
-        prev_state = self.character.state
-        self.character.tick()
+    def _on_frame_timer(self) -> bool:
+        self._on_frame_tick()
+        if self._frame_timer_id is not None:  # not stopped during the tick
+            self._frame_timer_id = None
+            # Slow down (or sleep) while sitting idle, full rate otherwise
+            self._reschedule_frame()
+        return GLib.SOURCE_REMOVE
+
+    def _on_frame_clock(self, widget: Gtk.DrawingArea, frame_clock: Gdk.FrameClock) -> bool:
+        # Displays faster than 60Hz skip refreshes until the next step is
+        # due, so movement speed doesn't depend on the refresh rate
+        now = frame_clock.get_frame_time() / 1_000_000
+        if now < self._next_frame_at:
+            return GLib.SOURCE_CONTINUE
+        interval = FRAME_INTERVAL_MS / 1000
+        deadline = self._next_frame_at + interval
+        if deadline <= now:
+            deadline = now + interval
+        self._next_frame_at = deadline
+
+        self._on_frame_tick()
+        if self._frame_tick_id is None:  # stopped, or unmapped onto the timer
+            return GLib.SOURCE_REMOVE
+        if self._is_quiescent():
+            self._frame_tick_id = None
+            self._next_frame_at = time.monotonic()
+            self._reschedule_frame()
+            return GLib.SOURCE_REMOVE
+        return GLib.SOURCE_CONTINUE
+
+    def _on_drawing_unmap(self, widget: Gtk.DrawingArea) -> None:
+        # The frame clock stops while unmapped; keep ticking on a timer
+        # (the next timer frame moves back to the clock once remapped)
+        if self._frame_tick_id is not None:
+            widget.remove_tick_callback(self._frame_tick_id)
+            self._frame_tick_id = None
+            self._next_frame_at = time.monotonic()
+            self._schedule_frame()
+
+    def _on_frame_tick(self) -> None:
+        # Slow idle ticks stand in for several frames, as does the first
+        # tick after a wake cut an idle interval short
+        interval_ms = self._frame_interval_ms
+        if self._frame_credit_ms:
+            interval_ms += self._frame_credit_ms
+            self._frame_credit_ms = 0
+        frames = interval_ms // FRAME_INTERVAL_MS
+
+        # Bind hot objects once; their attributes are re-read where a call
+        # in between (set_state, wander.tick) may have changed them
+        char = self.character
+        wander = self._wander
+        social = self._social
+
+        prev_state = char.state
+        char.tick(interval_ms)
+        state = char.state
+
+        # The original's death stumble runs on its own countdown rather
+        # than the character state, which a bridge write or menu action
+        # can change mid-stumble
+        if self._clone_death_ms is not None:
+            self._clone_death_ms -= interval_ms
+            if self._clone_death_ms <= 0:
+                self._on_clone_death_done()
+
+        clone = self._clone_window
+        if clone is not None:
+            clone.tick(interval_ms)
 
         # If a non-looping animation just finished (state changed),
         # clear the manual override so the bridge can take over again.
-        if self._manual_override and prev_state != self.character.state:
-            if not self.character.is_busy:
+        if self._manual_override and prev_state != state:
+            if not char.is_busy:
                 self._manual_override = False
                 logger.debug("Manual override cleared (animation finished)")
 
         # Clear social fight when attack -> celebrating transition happens
-        if prev_state == "attack" and self.character.state == "celebrating":
-            if self._social:
-                self._social.clear_fight()
+        if prev_state == "attack" and state == "celebrating":
+            if social:
+                social.clear_fight()
 
         # Detect doubling finished → spawn clone
         if (prev_state == "doubling"
-                and self.character.state == "clone_frozen"
+                and state == "clone_frozen"
                 and self._clone_window is None):
             self._spawn_clone()
 
+        drag_active = self._drag_active
+
         # Update pendulum swing during drag (keeps swinging when mouse stops)
-        if self._drag_active:
+        if drag_active:
+            if self._pending_motion is not None:
+                self._apply_drag_motion(*self._pending_motion)
+                self._pending_motion = None
             spring = -self._drag_swing * 0.05
             damping = -self._drag_swing_vel * 0.25
             self._drag_swing_vel += spring + damping
             self._drag_swing += self._drag_swing_vel
             swing = self._drag_swing
-            speed = abs(swing)
-            if speed < 0.2:
-                move = "drag"
-            elif swing < 0:
-                if speed < 0.6:
-                    move = "drag_left_slow"
-                elif speed < 1.5:
-                    move = "drag_left_fast"
-                else:
-                    move = "drag_left_vfast"
-            else:
-                if speed < 0.6:
-                    move = "drag_right_slow"
-                else:
-                    move = "drag_right_fast"
-            self.character.set_movement(move, -1)
+            idx = bisect.bisect_right(_DRAG_SWING_THRESHOLDS, abs(swing))
+            moves = _DRAG_MOVES_LEFT if swing < 0 else _DRAG_MOVES_RIGHT
+            move_name = moves[idx]
+            if char.move_state != move_name or char.facing != -1:
+                char.set_movement(move_name, -1)
 
         # Social engine: write position every N frames
-        if self._social and self._wander is not None:
-            move_name = {
-                Move.SIT: "sit", Move.WALK_GROUND: "walk",
-                Move.WALK_TOP: "walk", Move.CLIMB_LEFT: "climb",
-                Move.CLIMB_RIGHT: "climb", Move.FALL: "fall",
-                Move.THROW: "fall",
-            }.get(self._wander.move_state, "")
-            self._social.write_position(
-                self._wander.x, self._wander.y,
-                self._wander.direction, self.character.state,
-                move_name, self._wander._active_idx,
+        if social and wander is not None:
+            move_name = _SOCIAL_POS_MOVE_NAMES.get(wander.move_state, "")
+            social.write_position(
+                wander.x, wander.y, wander.direction, state,
+                move_name, wander._active_idx,
             )
 
         # Move unless dragging, wander disabled, or character is busy
         if (self._wander_enabled
-                and not self._drag_active
+                and not drag_active
                 and not self._clone_falling
-                and not self.character.is_busy
-                and self._wander is not None):
-            new_x, new_y = self._wander.tick(self.character.state)
+                and not char.is_busy
+                and wander is not None):
+            new_x, new_y = wander.tick(state, frames)
 
             # Social engine: get directive for social behaviors
             social_directive = None
             self._last_social_directive = None
-            if self._social and self.character.state == "idle":
-                move_name = {
-                    Move.SIT: "sit", Move.WALK_GROUND: "walk",
-                    Move.WALK_TOP: "walk",
-                }.get(self._wander.move_state, "")
-                social_directive = self._social.tick(
-                    self._wander.x, self._wander.y,
-                    self._wander.direction, self.character.state,
-                    self._wander._active_idx, move_name,
+            if social and state == "idle":
+                move_name = _SOCIAL_TICK_MOVE_NAMES.get(wander.move_state, "")
+                social_directive = social.tick(
+                    wander.x, wander.y, wander.direction, state,
+                    wander._active_idx, move_name,
                 )
                 # Handle fight directives
                 if social_directive.fight_role == "attacker":
                     self._manual_override = True
                     # Face toward the defender
-                    if social_directive.fight_peer_x > self._wander.x:
-                        self._wander.direction = 1
+                    if social_directive.fight_peer_x > wander.x:
+                        wander.direction = 1
                     else:
-                        self._wander.direction = -1
-                    self.character.set_state("attack")
+                        wander.direction = -1
+                    char.set_state("attack")
                 elif social_directive.fight_role == "defender":
                     # Face toward the attacker first (see the hit coming)
-                    if social_directive.fight_peer_x > self._wander.x:
-                        self._wander.direction = 1
+                    if social_directive.fight_peer_x > wander.x:
+                        wander.direction = 1
                         throw_dir = -1
                     else:
-                        self._wander.direction = -1
+                        wander.direction = -1
                         throw_dir = 1
                     # Compute throw to clear proximity zone
-                    from social_engine import SocialEngine
                     clear_dist = SocialEngine.PROXIMITY_FIGHT * self._size * 1.3
                     throw_vy = -2.5
-                    air_frames = 2 * abs(throw_vy) / WanderEngine.THROW_GRAVITY
+                    air_frames = 2 * abs(throw_vy) / _THROW_GRAVITY
                     throw_vx = clear_dist / max(air_frames, 1) * throw_dir
                     # Delayed throw — face attacker briefly, then get shoved
                     self._pending_throw = (throw_vx, throw_vy)
@@ -892,88 +1389,97 @@ class PetWindow(Gtk.Window):
 
             # Check if wander wants to trigger a character animation
             # Only apply during idle — don't override bridge states like attention
-            if self._wander.pending_anim:
-                anim = self._wander.pending_anim
-                self._wander.pending_anim = None
-                if self.character.state == "idle":
+            anim = wander.pending_anim
+            if anim:
+                wander.pending_anim = None
+                if char.state == "idle":
                     if anim == "clone_kill":
                         if self._clone_window is None:
                             self._manual_override = True
-                            self.character.set_state("doubling")
+                            char.set_state("doubling")
                     else:
-                        self.character.set_state(anim)
+                        char.set_state(anim)
 
             # Store directive for facing override in movement sync
             self._last_social_directive = social_directive
 
             # Social: pass flags to wander engine
-            if social_directive and social_directive.block_sit:
-                self._wander._social_block_sit = True
-            else:
-                self._wander._social_block_sit = False
-            # Peer very close = almost overlapping (half a sprite width)
             if social_directive:
-                self._wander._social_peer_nearby = social_directive.nearest_peer_dist < self._size * 0.5
+                wander._social_block_sit = social_directive.block_sit
+                # Peer very close = almost overlapping (half a sprite width)
+                wander._social_peer_nearby = social_directive.nearest_peer_dist < self._size * 0.5
             else:
-                self._wander._social_peer_nearby = False
+                wander._social_block_sit = False
+                wander._social_peer_nearby = False
 
             # Shift sprite inside the window to hug screen edges
             # Window stays put, character moves within it
-            ms = self._wander.move_state
-            if ms == Move.CLIMB_LEFT:
-                self._draw_offset_x = -int(self._size * 0.50)
-                self._draw_offset_y = 0
-                self._label_on_top = True
-            elif ms == Move.CLIMB_RIGHT:
-                self._draw_offset_x = int(self._size * 0.50)
-                self._draw_offset_y = 0
-                self._label_on_top = True
-            elif ms == Move.WALK_TOP:
-                self._draw_offset_x = 0
-                self._draw_offset_y = -int(self._size * 0.40)
-                self._label_on_top = False
-            else:
-                self._draw_offset_x = 0
-                self._draw_offset_y = 0
-                self._label_on_top = True
-            self.move(new_x, new_y)
+            (self._draw_offset_x, self._draw_offset_y,
+             self._label_on_top) = self._offset_table.get(wander.move_state, _NO_OFFSET)
+            if wander.moved:
+                self.move(new_x, new_y)
 
         # Sync movement state to character (for sprite selection)
-        # Skip during drag — drag sprites are set by _on_motion
-        if self._wander is not None and not self._drag_active and not self._clone_falling:
-            move_map = {
-                Move.WALK_GROUND: "walk",
-                Move.WALK_TOP: "ceiling",
-                Move.CLIMB_LEFT: "climb",
-                Move.CLIMB_RIGHT: "climb",
-                Move.FALL: "fall",
-                Move.THROW: "fall",
-                Move.BAD_LAND: "bad_land",
-                Move.GOOD_LAND: "good_land",
-                Move.HARD_LAND: "hard_land",
-                Move.SIT: "sit",
-                Move.KICK: "kick",
-                Move.JUMP: "jump_launch",
-            }
-            move_name = move_map.get(self._wander.move_state, "")
+        # Skip during drag — drag sprites are set above from the swing
+        if wander is not None and not drag_active and not self._clone_falling:
+            ms = wander.move_state
+            move_name = _MOVE_NAME_MAP.get(ms, "")
             # Climb sprites face left; face toward the wall
-            if self._wander.move_state == Move.CLIMB_LEFT:
+            if ms == Move.CLIMB_LEFT:
                 facing = -1
-            elif self._wander.move_state == Move.CLIMB_RIGHT:
+            elif ms == Move.CLIMB_RIGHT:
                 facing = 1
             else:
-                facing = self._wander.direction
+                facing = wander.direction
 
             # Social: override facing toward peer when sitting
-            if (self._social and move_name == "sit"
-                    and self._last_social_directive
-                    and self._last_social_directive.face_toward is not None):
-                facing = self._last_social_directive.face_toward
-
-            self.character.set_movement(move_name, facing)
-
-        self._drawing_area.queue_draw()
-        return True
+            directive = self._last_social_directive
+            if (social and move_name == "sit"
+                    and directive
+                    and directive.face_toward is not None):
+                facing = directive.face_toward
+
+            # Compared against the character itself, so a mascot swap
+            # can't leave a stale cached value behind
+            if char.move_state != move_name or char.facing != facing:
+                char.set_movement(move_name, facing)
+
+        # Nothing to paint while unmapped or fully covered
+        if self._visible:
+            self._queue_frame_draw()
+
+    def _build_offset_table(self) -> None:
+        """Per-Move (offset_x, offset_y, label_on_top) for the current size."""
+        size = self._size
+        self._offset_table = {
+            Move.CLIMB_LEFT: (-int(size * 0.50), 0, True),
+            Move.CLIMB_RIGHT: (int(size * 0.50), 0, True),
+            Move.WALK_TOP: (0, -int(size * 0.40), False),
+        }
+
+    def _queue_frame_draw(self) -> None:
+        """Invalidate what this frame changed: nothing if the rendered frame
+        is identical, just the sprite box while the layout is unchanged, the
+        whole window when the sprite offsets, the label side or the size
+        moved (the label follows the sprite)."""
+        char = self.character
+        layout = (self._draw_offset_x, self._draw_offset_y,
+                  self._label_on_top, self._size)
+        # Everything that picks the sprite image, plus the layout
+        render_sig = (char, char.state, char.move_state, char.frame,
+                      char.facing, layout)
+        if render_sig == self._last_render_sig:
+            return
+        self._last_render_sig = render_sig
+        if layout != self._drawn_layout:
+            self._drawn_layout = layout
+            self._drawing_area.queue_draw()
+            return
+        sprite_y = self._label_height if self._label_on_top else 0
+        self._drawing_area.queue_draw_area(
+            self._draw_offset_x, self._draw_offset_y + sprite_y,
+            self._size, self._size,
+        )
 
     # ------------------------------------------------------------------
     # Bridge
@@ -981,12 +1487,23 @@ class PetWindow(Gtk.Window):
 
     def _start_bridge(self) -> None:
         def on_state_change(new_state: str) -> None:
-            GLib.idle_add(self._apply_bridge_state, new_state)
+            # One pending idle at most; a burst of states collapses to the latest
+            fresh = self._pending_bridge_state is None
+            self._pending_bridge_state = new_state
+            if fresh:
+                GLib.idle_add(self._drain_bridge_state)
         try:
             self.bridge.start_watching(on_state_change)
         except Exception:
             logger.exception("Failed to start bridge watcher")
 
+    def _drain_bridge_state(self) -> bool:
+        new_state = self._pending_bridge_state
+        self._pending_bridge_state = None
+        if new_state is not None:
+            self._apply_bridge_state(new_state)
+        return GLib.SOURCE_REMOVE
+
     def _apply_bridge_state(self, new_state: str) -> bool:
         if self._manual_override:
             return False
@@ -996,6 +1513,7 @@ class PetWindow(Gtk.Window):
             if new_state == "doubling" and self._clone_window is None:
                 self._manual_override = True
             self.character.set_state(new_state)
+            self._wake_frame_timer()
         return False
 
     # ------------------------------------------------------------------
@@ -1003,8 +1521,7 @@ class PetWindow(Gtk.Window):
     # ------------------------------------------------------------------
 
     def _on_draw(self, widget: Gtk.DrawingArea, ctx: cairo.Context) -> bool:
-        ctx.set_operator(cairo.OPERATOR_SOURCE)
-        ctx.set_source_rgba(0, 0, 0, 0)
+        ctx.set_operator(cairo.OPERATOR_CLEAR)
         ctx.paint()
         ctx.set_operator(cairo.OPERATOR_OVER)
 
@@ -1013,18 +1530,24 @@ class PetWindow(Gtk.Window):
         # Label on top: sprite shifts down; label on bottom: sprite stays at 0
         sprite_y = self._label_height if self._label_on_top else 0
 
-        # Draw sprite (shifted to hug screen edges + label offset)
-        ctx.save()
-        ctx.translate(self._draw_offset_x, self._draw_offset_y + sprite_y)
-        self.character.draw(ctx, width, self._size)
-        ctx.restore()
+        # Draw sprite (shifted to hug screen edges + label offset).  The
+        # character doesn't touch the transform, so the common unshifted
+        # case (no project label, on the ground) needs no save/restore.
+        dx = self._draw_offset_x
+        dy = self._draw_offset_y + sprite_y
+        if dx or dy:
+            ctx.save()
+            ctx.translate(dx, dy)
+            self.character.draw(ctx, width, self._size)
+            ctx.restore()
+        else:
+            self.character.draw(ctx, width, self._size)
 
         # Draw project name label — positioned relative to sprite's draw offsets
         if self._project_name and self._label_height > 0:
-            ctx.save()
-            ctx.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-            ctx.set_font_size(11)
-            extents = ctx.text_extents(self._project_name)
+            if self._label_surface is None:
+                self._render_label()
+            extents = self._label_extents
 
             # Follow sprite x-offset partially (stay near sprite, slightly toward center)
             label_x_shift = self._draw_offset_x * 0.3
@@ -1036,38 +1559,73 @@ class PetWindow(Gtk.Window):
                 # Just below the sprite's visual bottom
                 text_y = self._draw_offset_y + self._size + 6
 
-            # Dark outline for readability on any background
-            ctx.set_source_rgba(0, 0, 0, 0.8)
-            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                ctx.move_to(text_x + dx, text_y + dy)
-                ctx.show_text(self._project_name)
-
-            # White text
-            ctx.set_source_rgba(1, 1, 1, 0.95)
-            ctx.move_to(text_x, text_y)
-            ctx.show_text(self._project_name)
-            ctx.restore()
+            # Blit at whole pixels so the cached glyphs stay sharp
+            pad = self._LABEL_PAD
+            ctx.set_source_surface(
+                self._label_surface,
+                round(text_x + extents.x_bearing - pad),
+                round(text_y + extents.y_bearing - pad),
+            )
+            ctx.paint()
 
         return True
 
+    _LABEL_PAD = 2  # px around the glyph box for the outline stroke
+
+    def _render_label(self) -> None:
+        """Rasterize the project name (white text, dark outline) once into
+        an ARGB surface that _on_draw blits every frame."""
+        name = self._project_name
+        scratch = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+        scratch.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        scratch.set_font_size(11)
+        extents = scratch.text_extents(name)
+
+        pad = self._LABEL_PAD
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32,
+            math.ceil(extents.width) + 2 * pad,
+            math.ceil(extents.height) + 2 * pad,
+        )
+        ctx = cairo.Context(surface)
+        ctx.set_font_face(scratch.get_font_face())
+        ctx.set_font_size(11)
+
+        # Build the glyph outlines once: stroke them dark for readability
+        # on any background, then fill the same path white
+        ctx.move_to(pad - extents.x_bearing, pad - extents.y_bearing)
+        ctx.text_path(name)
+        ctx.set_line_width(2.0)
+        ctx.set_line_join(cairo.LINE_JOIN_ROUND)
+        ctx.set_source_rgba(0, 0, 0, 0.8)
+        ctx.stroke_preserve()
+        ctx.set_source_rgba(1, 1, 1, 0.95)
+        ctx.fill()
+        surface.flush()
+
+        self._label_surface = surface
+        self._label_extents = extents
+
     # ------------------------------------------------------------------
     # Input
     # ------------------------------------------------------------------
 
     def _on_button_press(self, widget: Gtk.Window, event: Gdk.EventButton) -> bool:
+        self._wake_frame_timer()
         if event.button == 1:
             self._drag_active = True
-            self._drag_offset_x = event.x_root
-            self._drag_offset_y = event.y_root
+            x_root = event.x_root
+            y_root = event.y_root
             win_x, win_y = self.get_position()
-            self._drag_offset_x -= win_x
-            self._drag_offset_y -= win_y
-            self._drag_prev_x = event.x_root
-            self._drag_prev_y = event.y_root
+            self._drag_offset_x = x_root - win_x
+            self._drag_offset_y = y_root - win_y
+            self._drag_prev_x = x_root
+            self._drag_prev_y = y_root
             self._drag_vel_x = 0.0
             self._drag_vel_y = 0.0
             self._drag_swing = 0.0
             self._drag_swing_vel = 0.0
+            self._pending_motion = None
             self._draw_offset_x = 0
             self._draw_offset_y = 0
             self.character.set_movement("drag", -1)
@@ -1080,10 +1638,13 @@ class PetWindow(Gtk.Window):
     def _on_button_release(self, widget: Gtk.Window, event: Gdk.EventButton) -> bool:
         if event.button == 1:
             self._drag_active = False
+            if self._pending_motion is not None:
+                # Don't lose the last few px of movement for the drop/throw
+                self._apply_drag_motion(*self._pending_motion)
+                self._pending_motion = None
             if self._wander is not None:
                 win_x, win_y = self.get_position()
-                self._wander.x = float(win_x)
-                self._wander.y = float(win_y)
+                self._wander.set_position(float(win_x), float(win_y))
                 # Detect monitor switch on drop
                 self._wander.set_active_monitor_at(win_x, win_y)
 
@@ -1105,42 +1666,29 @@ class PetWindow(Gtk.Window):
             return True
         return False
 
+    def _apply_drag_motion(self, x_root: float, y_root: float) -> None:
+        """Move the window to the latest pointer position and fold it into
+        the throw velocity and the drag swing.  Called at most once per frame."""
+        self.move(int(x_root - self._drag_offset_x), int(y_root - self._drag_offset_y))
+        # Track real velocity for throw detection
+        dx = x_root - self._drag_prev_x
+        dy = y_root - self._drag_prev_y
+        self._drag_prev_x = x_root
+        self._drag_prev_y = y_root
+        self._drag_vel_x = self._drag_vel_x * 0.3 + dx * 0.7
+        self._drag_vel_y = self._drag_vel_y * 0.3 + dy * 0.7
+        push = dx * 0.01                         # mouse drags the swing
+        spring = -self._drag_swing * 0.025       # spring pulls back to center @60fps
+        damping = -self._drag_swing_vel * 0.06   # friction @60fps
+        self._drag_swing_vel += push + spring + damping
+        self._drag_swing += self._drag_swing_vel
+
     def _on_motion(self, widget: Gtk.Window, event: Gdk.EventMotion) -> bool:
         if self._drag_active:
-            new_x = int(event.x_root - self._drag_offset_x)
-            new_y = int(event.y_root - self._drag_offset_y)
-            self.move(new_x, new_y)
-
-            # Track real velocity for throw detection
-            dx = event.x_root - self._drag_prev_x
-            dy = event.y_root - self._drag_prev_y
-            self._drag_prev_x = event.x_root
-            self._drag_prev_y = event.y_root
-            self._drag_vel_x = self._drag_vel_x * 0.3 + dx * 0.7
-            self._drag_vel_y = self._drag_vel_y * 0.3 + dy * 0.7
-            push = dx * 0.01                         # mouse drags the swing
-            spring = -self._drag_swing * 0.025       # spring pulls back to center @60fps
-            damping = -self._drag_swing_vel * 0.06   # friction @60fps
-            self._drag_swing_vel += push + spring + damping
-            self._drag_swing += self._drag_swing_vel
-
-            swing = self._drag_swing
-            speed = abs(swing)
-            if speed < 0.2:
-                move = "drag"
-            elif swing < 0:  # swinging left
-                if speed < 0.6:
-                    move = "drag_left_slow"
-                elif speed < 1.5:
-                    move = "drag_left_fast"
-                else:
-                    move = "drag_left_vfast"
-            else:  # swinging right
-                if speed < 0.6:
-                    move = "drag_right_slow"
-                else:
-                    move = "drag_right_fast"
-            self.character.set_movement(move, -1)
+            # The window move and velocity/swing are applied once per frame
+            # in _on_frame_tick, however many motion events a high-rate
+            # mouse delivers
+            self._pending_motion = (event.x_root, event.y_root)
             return True
         return False
 
@@ -1149,7 +1697,28 @@ class PetWindow(Gtk.Window):
     # ------------------------------------------------------------------
 
     def _show_context_menu(self, event: Gdk.EventButton) -> None:
+        # The menu is built once and reused; only rebuilt when the mascot
+        # directory changes (its mtime moves when entries come and go)
+        mtime = self._sprites_dir_mtime()
+        if self._ctx_menu is None or mtime != self._ctx_menu_mtime:
+            self._build_context_menu()
+            self._ctx_menu_mtime = mtime
+        self._sync_context_menu()
+        self._ctx_menu.popup_at_pointer(event)
+
+    def _sprites_dir_mtime(self) -> int:
+        if not self._sprites_dir:
+            return 0
+        try:
+            return os.stat(self._sprites_dir).st_mtime_ns
+        except OSError:
+            return 0
+
+    def _build_context_menu(self) -> None:
+        if self._ctx_menu is not None:
+            self._ctx_menu.destroy()
         menu = Gtk.Menu()
+        items = {}
 
         # Project name header (non-clickable)
         if self._project_name:
@@ -1160,34 +1729,32 @@ class PetWindow(Gtk.Window):
 
         # Auto mode — follow bridge
         auto_item = Gtk.CheckMenuItem(label="Auto (follow Claude)")
-        auto_item.set_active(not self._manual_override)
-        auto_item.connect("toggled", self._on_menu_auto)
+        items["auto"] = (auto_item, auto_item.connect("toggled", self._on_menu_auto))
         menu.append(auto_item)
 
         # Wander toggle
         wander_item = Gtk.CheckMenuItem(label="Wander")
-        wander_item.set_active(self._wander_enabled)
-        wander_item.connect("toggled", self._on_menu_toggle_wander)
+        items["wander"] = (
+            wander_item, wander_item.connect("toggled", self._on_menu_toggle_wander))
         menu.append(wander_item)
 
         # Scale submenu
         scale_item = Gtk.MenuItem(label="Scale")
         scale_sub = Gtk.Menu()
-        current_scale = self._size / SPRITE_BASE
+        scale_radios = []
         group = None
         for s in SCALE_OPTIONS:
-            label = f"{s:.1f}x"
-            if s == current_scale:
-                label += " *"
-            radio = Gtk.RadioMenuItem(label=label, group=group)
+            radio = Gtk.RadioMenuItem(label=f"{s:.1f}x", group=group)
             group = radio
-            radio.set_active(abs(s - current_scale) < 0.01)
             radio.connect("toggled", self._on_menu_scale, s)
             scale_sub.append(radio)
+            scale_radios.append((radio, s))
         scale_item.set_submenu(scale_sub)
         menu.append(scale_item)
+        items["scale"] = scale_radios
 
         # Mascot submenu (if sprites_dir is set and has multiple mascots)
+        mascot_radios = []
         if self._sprites_dir:
             mascots = self._list_mascots()
             if len(mascots) > 1:
@@ -1197,11 +1764,12 @@ class PetWindow(Gtk.Window):
                 for name, path in mascots:
                     radio = Gtk.RadioMenuItem(label=name, group=group)
                     group = radio
-                    radio.set_active(path == self._mascot_path)
                     radio.connect("toggled", self._on_menu_mascot, path)
                     mascot_sub.append(radio)
+                    mascot_radios.append((radio, path))
                 mascot_item.set_submenu(mascot_sub)
                 menu.append(mascot_item)
+        items["mascot"] = mascot_radios
 
         menu.append(Gtk.SeparatorMenuItem())
 
@@ -1232,13 +1800,39 @@ class PetWindow(Gtk.Window):
         menu.append(quit_item)
 
         menu.show_all()
-        menu.popup_at_pointer(event)
+        self._ctx_menu = menu
+        self._ctx_menu_items = items
+
+    def _sync_context_menu(self) -> None:
+        """Bring the cached menu's toggles and radios in line with current state."""
+        items = self._ctx_menu_items
+
+        # Check items: block their handlers, set_active() would fire them
+        auto_item, handler = items["auto"]
+        with auto_item.handler_block(handler):
+            auto_item.set_active(not self._manual_override)
+        wander_item, handler = items["wander"]
+        with wander_item.handler_block(handler):
+            wander_item.set_active(self._wander_enabled)
+
+        # Radio handlers ignore the current scale/mascot, so no blocking needed
+        current_scale = self._size / SPRITE_BASE
+        for radio, s in items["scale"]:
+            label = f"{s:.1f}x"
+            if s == current_scale:
+                label += " *"
+            radio.set_label(label)
+            if abs(s - current_scale) < 0.01:
+                radio.set_active(True)
+        for radio, path in items["mascot"]:
+            if path == self._mascot_path:
+                radio.set_active(True)
 
     def _on_fight_throw_start(self) -> bool:
         """Start the throw after facing the attacker briefly."""
-        if self._wander and hasattr(self, '_pending_throw'):
+        if self._wander and self._pending_throw is not None:
             vx, vy = self._pending_throw
-            del self._pending_throw
+            self._pending_throw = None
             # Flip facing away from attacker (throw direction)
             self._wander.direction = 1 if vx > 0 else -1
             self._wander._start_throw(vx, vy)
@@ -1261,16 +1855,19 @@ class PetWindow(Gtk.Window):
     def _on_menu_kick(self, widget: Gtk.MenuItem) -> None:
         if self._wander is not None:
             self._wander._start_kick()
+            self._wake_frame_timer()
 
     def _on_menu_jump(self, widget: Gtk.MenuItem) -> None:
         if self._wander is not None:
             self._wander._start_jump()
+            self._wake_frame_timer()
 
     def _on_menu_clone_kill(self, widget: Gtk.MenuItem) -> None:
         if self._clone_window is not None:
             return  # already running
         self._manual_override = True
         self.character.set_state("doubling")
+        self._wake_frame_timer()
 
     def _spawn_clone(self) -> None:
         """Spawn a clone window that 'kills' the original."""
@@ -1284,8 +1881,8 @@ class PetWindow(Gtk.Window):
         clone_y = win_y + (self._label_height if self._label_on_top else 0)
 
         # Attack animation: stand, jump, kick, kick, stand victorious
-        self._clone_window = CloneWindow(
-            sprites=self.character._sprites,
+        self._clone_window = CloneWindow.spawn(
+            get_sprite=self.character.get_sprite,
             indices=[27, 28, 29],
             delay=300,
             size=self._size,
@@ -1298,33 +1895,30 @@ class PetWindow(Gtk.Window):
 
     def _on_clone_done(self, clone_win: CloneWindow) -> None:
         """Clone finished its attack. Original dies in place, clone stays."""
-        # Keep clone alive while original plays death animation
+        # Keep clone alive while original plays death animation; after
+        # the death sprites (3 frames x 300ms) the frame tick swaps over
         self.character.set_state("stumble")
-        # After death sprites finish (3 frames × 300ms = 900ms), swap
-        GLib.timeout_add(900, self._on_clone_death_done)
+        self._clone_death_ms = 900
         logger.debug("Clone attack done, original dying")
 
-    def _on_clone_death_done(self) -> bool:
+    def _on_clone_death_done(self) -> None:
         """Original finished dying. Hide it, clone takes over."""
-        if self._clone_window is None:
-            return False
+        self._clone_death_ms = None
         clone_x, clone_y = self._clone_window.get_position()
         # Hide original, then seamlessly appear at clone spot
         self.hide()
-        self._clone_window.destroy()
+        self._clone_window.release()
         self._clone_window = None
         self._clone_falling = False
 
         if self._wander:
-            self._wander.x = float(clone_x)
-            self._wander.y = float(clone_y)
+            self._wander.set_position(float(clone_x), float(clone_y))
         self.move(clone_x, clone_y)
         self.show()
 
         self._manual_override = False
         self.character.set_state("idle")
         logger.debug("Clone kill complete, moved to (%d, %d)", clone_x, clone_y)
-        return False
 
     def _on_menu_auto(self, widget: Gtk.CheckMenuItem) -> None:
         self._manual_override = not widget.get_active()
@@ -1333,9 +1927,11 @@ class PetWindow(Gtk.Window):
             state = self.bridge.get_state()
             if state:
                 self.character.set_state(state)
+                self._wake_frame_timer()
 
     def _on_menu_toggle_wander(self, widget: Gtk.CheckMenuItem) -> None:
         self._wander_enabled = widget.get_active()
+        self._wake_frame_timer()
 
     def _on_menu_scale(self, widget: Gtk.RadioMenuItem, scale: float) -> None:
         if not widget.get_active():
@@ -1345,50 +1941,58 @@ class PetWindow(Gtk.Window):
             return
         win_x, win_y = self.get_position()
         self._size = new_size
+        self._build_offset_table()
+        self._label_surface = None  # re-render the label on next draw
         total_h = new_size + self._label_height
         self._drawing_area.set_size_request(new_size, total_h)
         # set_size_request on the window itself forces the resize even when non-resizable
         self.set_size_request(new_size, total_h)
         self._init_wander()
-        self._wander.x = float(win_x)
         # Snap to ground after rescale (pet size changed so old y is wrong)
-        self._wander.y = self._wander.y_max
+        self._wander.set_position(float(win_x), self._wander.y_max)
         self.move(int(self._wander.x), int(self._wander.y))
+        self._wake_frame_timer()  # new engine, new sit timer
         logger.debug("Scale changed to %.1fx (%dpx)", scale, new_size)
 
     def _list_mascots(self) -> list[tuple[str, str]]:
         """Return sorted list of (display_name, path) for mascots in sprites_dir."""
-        import os
-        result = []
-        for entry in sorted(os.listdir(self._sprites_dir)):
-            path = os.path.join(self._sprites_dir, entry)
-            if os.path.isdir(path):
-                result.append((entry.replace("_", " ").title(), path))
-        return result
+        # scandir gets the entry type from the directory listing itself, so
+        # only symlinked mascots cost a stat
+        with os.scandir(self._sprites_dir) as it:
+            entries = sorted((e.name, e.path) for e in it if e.is_dir())
+        return [(name.replace("_", " ").title(), path) for name, path in entries]
 
     def _on_menu_mascot(self, widget: Gtk.RadioMenuItem, path: str) -> None:
         if not widget.get_active() or path == self._mascot_path:
             return
         from sprite_character import SpriteCharacter
         new_char = SpriteCharacter(path)
-        if not new_char._sprites:
+        if not new_char._sprite_paths:
             logger.warning("No sprites in %s, ignoring", path)
             return
         self._mascot_path = path
         self.character = new_char
-        logger.info("Switched mascot to %s (%d sprites)", path, len(new_char._sprites))
-        # Persist selection as default
+        self._wake_frame_timer()
+        logger.info("Switched mascot to %s (%d sprites)", path, len(new_char._sprite_paths))
+        # Persist selection as default; quick re-picks collapse into one write
+        if self._cfg_save_id is None:
+            self._cfg_save_id = GLib.timeout_add(500, self._flush_config)
+
+    def _flush_config(self) -> bool:
+        """Save the current mascot as the default in the config file."""
+        self._cfg_save_id = None
         try:
-            from main import load_config, save_config
             cfg = load_config()
-            cfg["mascot"] = os.path.basename(path)
+            cfg["mascot"] = os.path.basename(self._mascot_path)
             save_config(cfg)
         except Exception:
             pass
+        return False
 
     def _on_menu_set_state(self, widget: Gtk.MenuItem, state: str) -> None:
         self._manual_override = True
         self.character.set_state(state)
+        self._wake_frame_timer()
 
         # Cancel any pending menu timeout
         if self._menu_timeout_id is not None:
@@ -1396,12 +2000,18 @@ class PetWindow(Gtk.Window):
             self._menu_timeout_id = None
 
         # Looping states get an auto-return to idle after ~3 loops
-        cfg = self.character._state_config.get(state, {})
-        if cfg.get("loop", True):
-            n_frames = cfg.get("frames") or len(cfg.get("sprites", [1]))
-            duration_ms = cfg["delay"] * n_frames * 3
-            self._menu_timeout_id = GLib.timeout_add(
-                duration_ms, self._on_menu_timeout)
+        # (configs are normalized at load, so loop/n_frames are always set)
+        cfg = self.character._state_config.get(state)
+        if cfg is not None and cfg.loop:
+            duration_ms = cfg.delay * cfg.n_frames * 3
+            if duration_ms >= 1000:
+                # Whole-second timers can be batched with other wakeups;
+                # the preview length doesn't need ms precision
+                self._menu_timeout_id = GLib.timeout_add_seconds(
+                    round(duration_ms / 1000), self._on_menu_timeout)
+            else:
+                self._menu_timeout_id = GLib.timeout_add(
+                    duration_ms, self._on_menu_timeout)
 
     def _on_menu_timeout(self) -> bool:
         """Return to idle after a menu-selected looping animation preview."""
@@ -1423,6 +2033,9 @@ class PetWindow(Gtk.Window):
         if self._menu_timeout_id is not None:
             GLib.source_remove(self._menu_timeout_id)
             self._menu_timeout_id = None
+        if self._cfg_save_id is not None:
+            GLib.source_remove(self._cfg_save_id)
+            self._flush_config()
         try:
             self.bridge.stop_watching()
         except Exception:
@@ -1432,14 +2045,13 @@ class PetWindow(Gtk.Window):
 
     def _on_realize(self, widget: Gtk.Window) -> None:
         """Disable compositor shadow/border on this window."""
+        # Drag motion is already coalesced to one update per frame in
+        # _on_frame_tick; take raw events so each frame sees the newest
+        # pointer position rather than GTK's compressed one.
+        self.get_window().set_event_compression(False)
         try:
             xid = self.get_window().get_xid()
-            subprocess.Popen(
-                ["xprop", "-id", str(xid),
-                 "-f", "_COMPTON_SHADOW", "32c",
-                 "-set", "_COMPTON_SHADOW", "0"],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
+            _disable_compositor_shadow(xid)
             logger.debug("Set _COMPTON_SHADOW=0 on xid %d", xid)
         except Exception:
             logger.debug("Could not set _COMPTON_SHADOW")
@@ -6,18 +6,29 @@ sitting near each other, face nearby peers, and occasionally fight.
 
 from __future__ import annotations
 
-import glob
 import logging
 import os
 import random
+import re
+import sys
 import tempfile
+import threading
 import time
 from dataclasses import dataclass, field
 
+try:
+    from gi.repository import Gio
+except ImportError:
+    # Without Gio, _read_peers falls back to scanning /tmp every read.
+    Gio = None
+
 logger = logging.getLogger(__name__)
 
+# Peer position file path; group 1 is the peer's project hash.
+_POS_RE = re.compile(r"/tmp/claude-pet-([^/]+)-pos")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PeerInfo:
     """Position and state of a remote pet instance."""
     hash: str
@@ -33,7 +44,7 @@ class PeerInfo:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialDirective:
     """Instructions from the social engine to the pet window."""
     block_sit: bool = False
@@ -47,6 +58,7 @@ class SocialEngine:
     """Coordinates social behaviors between pet instances via position files."""
 
     WRITE_INTERVAL = 10       # write every N frames (~166ms at 60fps)
+    HEARTBEAT_S = 2.0         # rewrite an unchanged position this often (< STALE_THRESHOLD)
     READ_INTERVAL_MS = 300    # read peers every 300ms
     STALE_THRESHOLD = 3.0     # discard peers older than 3 seconds
     FIGHT_CHANCE = 0.03       # ~3% per second
@@ -62,7 +74,28 @@ class SocialEngine:
         self._pet_height = pet_height
         self._pos_file = f"/tmp/claude-pet-{my_hash}-pos"
         self._peers: list[PeerInfo] = []
+        # Parsed peer files by hash.  With a /tmp monitor only files named
+        # in its events (_dirty) are re-read; otherwise every read rescans.
+        self._peer_cache: dict[str, PeerInfo] = {}
+        self._dirty: set[str] = set()
+        self._proposers: list[PeerInfo] = []  # peers whose fight_target is us
+        self._monitor = None
+        self._seeded = False
         self._frame_count = 0
+        self._last_written: tuple | None = None  # last position line's fields
+        # Walking moves x every frame; only moving a quarter sprite counts
+        # as a change worth writing (state changes and the heartbeat still
+        # write the exact position)
+        self._pos_quantum = max(1, pet_size // 4)
+        self._last_write_time = 0.0
+        # Position file IO runs on a writer thread so the GTK main loop never
+        # blocks on disk; it only ever writes the newest queued line.
+        self._pending_line: str | None = None
+        self._slot_lock = threading.Lock()   # guards _pending_line/_closed
+        self._file_lock = threading.Lock()   # serializes writes vs cleanup()
+        self._write_event = threading.Event()
+        self._writer: threading.Thread | None = None
+        self._closed = False
         self._last_read = 0.0
         self._last_fight = 0.0
         self._fight_target: str = ""  # hash of peer we want to fight (proposal)
@@ -74,66 +107,179 @@ class SocialEngine:
     def write_position(self, x: float, y: float, facing: int,
                        state: str, move_state: str,
                        monitor_idx: int) -> None:
-        """Write current position to the shared file (atomic via rename)."""
+        """Queue the current position for the writer thread, which
+        replaces the shared file atomically (temp file + rename).
+
+        Skips the write when nothing peers care about has changed (x/y
+        within the same quarter-sprite cell), except for a heartbeat every
+        HEARTBEAT_S so peers don't drop us as stale.
+        """
         self._frame_count += 1
         if self._frame_count % self.WRITE_INTERVAL != 0:
             return
 
+        now = time.time()
+        q = self._pos_quantum
+        key = (int(x // q), int(y // q), facing, state, move_state,
+               monitor_idx, self._fight_target)
+        if (key == self._last_written
+                and now - self._last_write_time < self.HEARTBEAT_S):
+            return
+
         line = (f"{x},{y},{self._pet_size},{self._pet_height},"
                 f"{facing},{state},{move_state},{monitor_idx},"
-                f"{self._fight_target},{time.time():.3f}\n")
+                f"{self._fight_target},{now:.3f}\n")
+        with self._slot_lock:
+            if self._closed:
+                return
+            self._pending_line = line  # latest wins
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="social-writer", daemon=True)
+            self._writer.start()
+        self._write_event.set()
+        self._last_written = key
+        self._last_write_time = now
+
+    def _writer_loop(self) -> None:
+        """Writer thread: flush the newest pending line until cleanup()."""
+        while True:
+            self._write_event.wait()
+            self._write_event.clear()
+            with self._slot_lock:
+                if self._closed:
+                    return
+                line, self._pending_line = self._pending_line, None
+            if line is None:
+                continue
+            with self._file_lock:
+                if self._closed:  # cleanup() ran while we picked up the line
+                    return
+                # Write-then-rename so readers never see a partial line and
+                # an unlinked file (state-hook.sh, make stop) is just recreated
+                try:
+                    fd, tmp = tempfile.mkstemp(dir="/tmp", prefix="claude-pet-pos-")
+                    os.write(fd, line.encode())
+                    os.close(fd)
+                    os.rename(tmp, self._pos_file)
+                except OSError:
+                    pass
+
+    def _start_monitor(self) -> bool:
+        """Watch /tmp for peer position file changes with a Gio monitor.
+
+        Same approach as ClaudeBridge: the directory is watched and events
+        are filtered by basename.  Returns False if no monitor is available.
+        """
+        if Gio is None:
+            return False
+        try:
+            monitor = Gio.File.new_for_path("/tmp").monitor_directory(
+                Gio.FileMonitorFlags.NONE, None
+            )
+        except Exception:
+            return False
+        self._monitor = monitor
+        self._monitor.connect("changed", self._on_monitor_event)
+        return True
+
+    def _on_monitor_event(self, monitor, file, other_file, event_type) -> None:
+        """Mark a peer's position file for re-reading on the next read."""
+        for f in (file, other_file):
+            if f is None:
+                continue
+            path = f.get_path()
+            m = _POS_RE.fullmatch(path) if path else None
+            if m and m.group(1) != self._my_hash:
+                self._dirty.add(path)
+
+    @staticmethod
+    def _parse_peer(path: str, peer_hash: str) -> PeerInfo | None:
+        """Parse one position file.  Returns None if it is missing or bad."""
         try:
-            fd, tmp = tempfile.mkstemp(dir="/tmp", prefix="claude-pet-pos-")
-            os.write(fd, line.encode())
-            os.close(fd)
-            os.rename(tmp, self._pos_file)
-        except OSError:
-            pass
+            with open(path) as f:
+                line = f.readline().strip()
+            if not line:
+                return None
+            parts = line.split(",")
+            if len(parts) < 10:
+                return None
+            return PeerInfo(
+                hash=peer_hash,
+                x=float(parts[0]),
+                y=float(parts[1]),
+                width=int(parts[2]),
+                height=int(parts[3]),
+                facing=int(parts[4]),
+                # Interned so tick()'s checks against the "idle"/"walk"
+                # literals hit the identity fast path
+                state=sys.intern(parts[5]),
+                move_state=sys.intern(parts[6]),
+                monitor_idx=int(parts[7]),
+                fight_target=parts[8],
+                timestamp=float(parts[9]),
+            )
+        except (OSError, ValueError, IndexError):
+            return None
 
     def _read_peers(self) -> None:
-        """Glob position files and parse peer positions, skipping self and stale."""
+        """Refresh peer positions, skipping self and stale entries.
+
+        The first read scans /tmp to seed the cache and starts the file
+        monitor; after that only files the monitor reported are re-read
+        (a peer that was deleted fails to parse and is dropped).  Without
+        a monitor every read rescans and re-parses all peer files.
+        """
         now = time.time()
         if now - self._last_read < self.READ_INTERVAL_MS / 1000.0:
             return
         self._last_read = now
 
-        peers = []
-        for path in glob.glob("/tmp/claude-pet-*-pos"):
-            # Extract hash from filename: /tmp/claude-pet-{hash}-pos
-            basename = os.path.basename(path)
-            if not basename.startswith("claude-pet-") or not basename.endswith("-pos"):
+        cache = self._peer_cache
+        if not self._seeded or self._monitor is None:
+            if not self._seeded:
+                self._seeded = True
+                self._start_monitor()
+            self._dirty.clear()
+            cache.clear()
+            # scandir hands back names without a stat per entry; the
+            # _POS_RE match below does the filtering
+            try:
+                with os.scandir("/tmp") as it:
+                    paths = [entry.path for entry in it
+                             if entry.name.startswith("claude-pet-")]
+            except OSError:
+                paths = []
+        else:
+            paths, self._dirty = self._dirty, set()
+
+        for path in paths:
+            m = _POS_RE.fullmatch(path)
+            if not m:
                 continue
-            peer_hash = basename[len("claude-pet-"):-len("-pos")]
+            peer_hash = m.group(1)
             if peer_hash == self._my_hash:
                 continue
+            peer = self._parse_peer(path, peer_hash)
+            if peer is not None:
+                cache[peer_hash] = peer
+            else:
+                cache.pop(peer_hash, None)
 
-            try:
-                with open(path) as f:
-                    line = f.readline().strip()
-                if not line:
-                    continue
-                parts = line.split(",")
-                if len(parts) < 10:
-                    continue
-                peer = PeerInfo(
-                    hash=peer_hash,
-                    x=float(parts[0]),
-                    y=float(parts[1]),
-                    width=int(parts[2]),
-                    height=int(parts[3]),
-                    facing=int(parts[4]),
-                    state=parts[5],
-                    move_state=parts[6],
-                    monitor_idx=int(parts[7]),
-                    fight_target=parts[8],
-                    timestamp=float(parts[9]),
-                )
-                if now - peer.timestamp <= self.STALE_THRESHOLD:
-                    peers.append(peer)
-            except (OSError, ValueError, IndexError):
-                continue
-
+        # Staleness is checked in memory; a peer that stops writing (killed
+        # without cleanup) ages out here without any disk access, and is
+        # re-read if its file ever changes again.
+        peers = []
+        proposers = []
+        for peer_hash, peer in list(cache.items()):
+            if now - peer.timestamp <= self.STALE_THRESHOLD:
+                peers.append(peer)
+                if peer.fight_target == self._my_hash:
+                    proposers.append(peer)
+            else:
+                del cache[peer_hash]
         self._peers = peers
+        self._proposers = proposers
 
     def tick(self, x: float, y: float, facing: int,
              state: str, monitor_idx: int,
@@ -163,6 +309,13 @@ class SocialEngine:
             return directive
 
         directive.nearest_peer_dist = nearest_dist
+
+        # Nothing below can fire when every peer is beyond the widest
+        # proximity bound and no fight is pending
+        if (not self._fight_target and not self._fight_active
+                and nearest_dist > self.PROXIMITY_FACE * self._pet_size):
+            return directive
+
         now = time.time()
 
         # Expire stale fight proposals
@@ -176,25 +329,25 @@ class SocialEngine:
             if not self._fight_delivered:
                 self._fight_delivered = True
                 directive.fight_role = self._fight_role
-                for peer in self._peers:
-                    if peer.hash == self._fight_target:
-                        directive.fight_peer_x = peer.x
+                peer = self._peer_cache.get(self._fight_target)
+                if peer is not None:
+                    directive.fight_peer_x = peer.x
                 logger.debug("Fight: %s against %s", self._fight_role, self._fight_target)
             return directive
 
         # --- Check for mutual targeting (handshake complete) ---
         if self._fight_target and not self._fight_active:
-            for peer in self._peers:
-                if (peer.hash == self._fight_target
-                        and peer.fight_target == self._my_hash
-                        and peer.monitor_idx == monitor_idx):
-                    # Both sides proposed — fight is on!
-                    # Re-check proximity at confirmation time
-                    dist = abs(peer.x - x)
-                    if dist > self.PROXIMITY_FIGHT * self._pet_size:
-                        # Too far now, cancel
-                        self._fight_target = ""
-                        break
+            peer = self._peer_cache.get(self._fight_target)
+            if (peer is not None
+                    and peer.fight_target == self._my_hash
+                    and peer.monitor_idx == monitor_idx):
+                # Both sides proposed — fight is on!
+                # Re-check proximity at confirmation time
+                dist = abs(peer.x - x)
+                if dist > self.PROXIMITY_FIGHT * self._pet_size:
+                    # Too far now, cancel
+                    self._fight_target = ""
+                else:
                     self._fight_active = True
                     self._last_fight = now
                     if self._my_hash < peer.hash:
@@ -209,11 +362,11 @@ class SocialEngine:
                     return directive
 
         # --- Check if a peer is proposing to us (respond with counter-proposal) ---
-        if not self._fight_target and now - self._last_fight > self.FIGHT_COOLDOWN:
-            for peer in self._peers:
-                if (peer.fight_target == self._my_hash
-                        and peer.monitor_idx == monitor_idx
-                        and state == "idle" and move_state == "walk"):
+        if (not self._fight_target and self._proposers
+                and state == "idle" and move_state == "walk"
+                and now - self._last_fight > self.FIGHT_COOLDOWN):
+            for peer in self._proposers:
+                if peer.monitor_idx == monitor_idx:
                     dist = abs(peer.x - x)
                     if dist <= self.PROXIMITY_FIGHT * self._pet_size:
                         self._fight_target = peer.hash
@@ -259,8 +412,17 @@ class SocialEngine:
         logger.debug("Fight cleared")
 
     def cleanup(self) -> None:
-        """Remove position file on shutdown."""
-        try:
-            os.unlink(self._pos_file)
-        except OSError:
-            pass
+        """Stop the writer thread and remove the position file on shutdown."""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
+        with self._slot_lock:
+            self._closed = True
+            self._pending_line = None
+        self._write_event.set()
+        # Taking the file lock waits out a write already in progress
+        with self._file_lock:
+            try:
+                os.unlink(self._pos_file)
+            except OSError:
+                pass
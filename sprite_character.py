@@ -13,9 +13,32 @@ Conforms to the Character protocol expected by PetWindow.
 from __future__ import annotations
 
 import os
+import re
+from typing import NamedTuple
 
 import cairo
 
+from claude_bridge import VALID_STATES
+
+# shime1.png .. shime199.png; numbering may have gaps
+_SPRITE_RE = re.compile(r"shime([1-9][0-9]?|1[0-9][0-9])\.png")
+
+
+class _Anim(NamedTuple):
+    """An animation config with its defaults resolved."""
+    sprites: tuple[int, ...]
+    delay: int
+    loop: bool
+    loops: int
+    next: str
+    n_frames: int
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> _Anim:
+        sprites = tuple(cfg["sprites"])
+        return cls(sprites, cfg["delay"], cfg.get("loop", True),
+                   cfg.get("loops", 2), cfg.get("next", "idle"), len(sprites))
+
 
 class SpriteCharacter:
     """Character driven by Shimeji-style PNG sprites.
@@ -23,6 +46,13 @@ class SpriteCharacter:
     Loads shime1.png .. shimeN.png from ``mascot_path/img/``.
     """
 
+    __slots__ = (
+        "state", "frame", "facing", "move_state",
+        "_tick_accum", "_loops_done", "_cfg",
+        "_sprite_paths", "_sprites", "_state_config", "_move_config",
+        "_frame_cache", "_frame_cache_size",
+    )
+
     _TICK_MS: int = 1000 // 60  # ~16ms, must match FRAME_INTERVAL_MS
 
     def __init__(self, mascot_path: str) -> None:
@@ -32,26 +62,38 @@ class SpriteCharacter:
         self.move_state: str = ""   # set by PetWindow: walk, sit, climb, fall, ceiling
         self._tick_accum: int = 0
         self._loops_done: int = 0
+        # (sprite index, flipped) -> sprite pre-scaled to _frame_cache_size
+        self._frame_cache: dict[tuple[int, bool], cairo.ImageSurface] = {}
+        self._frame_cache_size: tuple[int, int] = (0, 0)
 
-        # Load all sprites
+        # Find the sprites in one directory scan; PNGs are decoded on first
+        # use by get_sprite(), since a pose set only shows a few of them
+        self._sprite_paths: dict[int, str] = {}
         self._sprites: dict[int, cairo.ImageSurface] = {}
         # Support both flat dir and mascot/img/ layout
         img_dir = os.path.join(mascot_path, "img")
         if not os.path.isdir(img_dir):
             img_dir = mascot_path
-        # Scan up to 200 to handle gaps in numbering
-        for i in range(1, 200):
-            path = os.path.join(img_dir, f"shime{i}.png")
-            if os.path.exists(path):
-                # Skip blank/transparent sprites (fully transparent PNGs are tiny)
-                if os.path.getsize(path) < 500:
-                    continue
-                self._sprites[i] = cairo.ImageSurface.create_from_png(path)
+        try:
+            with os.scandir(img_dir) as it:
+                for entry in it:
+                    m = _SPRITE_RE.fullmatch(entry.name)
+                    if not m:
+                        continue
+                    try:
+                        # Skip blank/transparent sprites (fully transparent PNGs are tiny)
+                        if entry.stat().st_size < 500:
+                            continue
+                    except OSError:
+                        continue
+                    self._sprite_paths[int(m.group(1))] = entry.path
+        except OSError:
+            pass
 
         # State-override animations (triggered by Claude hooks or wander engine)
         # These freeze movement and take priority over move animations.
         # sprites: list of shime indices, delay: ms per frame
-        self._state_config: dict[str, dict] = {
+        state_config: dict[str, dict] = {
             "idle": {
                 "sprites": [1],
                 "delay": 500,
@@ -109,7 +151,7 @@ class SpriteCharacter:
         }
 
         # Movement animations (used when Claude state is "idle")
-        self._move_config: dict[str, dict] = {
+        move_config: dict[str, dict] = {
             "walk": {
                 "sprites": [1, 2, 1, 3],
                 "delay": 120,
@@ -176,16 +218,35 @@ class SpriteCharacter:
             },
         }
 
+        # Every state the bridge can deliver must have an animation, so
+        # set_state() never silently drops a hook-driven transition
+        missing = VALID_STATES - state_config.keys()
+        if missing:
+            raise ValueError(
+                f"No animation config for bridge states: {', '.join(sorted(missing))}"
+            )
+
         # Replace missing sprite indices with fallback (first available sprite)
-        if self._sprites:
-            fallback = min(self._sprites.keys())
-            for configs in (self._state_config, self._move_config):
+        if self._sprite_paths:
+            fallback = min(self._sprite_paths)
+            for configs in (state_config, move_config):
                 for cfg in configs.values():
                     cfg["sprites"] = [
-                        s if s in self._sprites else fallback
+                        s if s in self._sprite_paths else fallback
                         for s in cfg["sprites"]
                     ]
 
+        # Resolve defaults once so tick() reads plain attributes instead of
+        # applying .get() fallbacks and len() on every frame
+        self._state_config: dict[str, _Anim] = {
+            name: _Anim.from_config(cfg) for name, cfg in state_config.items()
+        }
+        self._move_config: dict[str, _Anim] = {
+            name: _Anim.from_config(cfg) for name, cfg in move_config.items()
+        }
+
+        self._cfg: _Anim = self._state_config["idle"]  # see _active_config()
+
     # ------------------------------------------------------------------
     # State machine
     # ------------------------------------------------------------------
@@ -196,74 +257,123 @@ class SpriteCharacter:
             self.frame = 0
             self._tick_accum = 0
             self._loops_done = 0
+            self._cfg = self._resolve_config()
 
     def set_movement(self, move: str, facing: int) -> None:
-        """Called by PetWindow each frame with wander state and direction."""
-        self.move_state = move
+        """Called by PetWindow when the wander state or direction changes."""
+        if move != self.move_state:
+            self.move_state = move
+            self._cfg = self._resolve_config()
         self.facing = facing
 
     @property
     def is_busy(self) -> bool:
-        cfg = self._active_config()
-        return not cfg.get("loop", True)
+        return not self._active_config().loop
+
+    def _active_config(self) -> _Anim:
+        """Get the config for the currently playing animation.
 
-    def _active_config(self) -> dict:
-        """Get the config for the currently playing animation."""
+        Cached in _cfg; every assignment to state or move_state must go
+        through set_state()/set_movement() or refresh it.
+        """
+        return self._cfg
+
+    def _resolve_config(self) -> _Anim:
         if self.state != "idle":
             return self._state_config[self.state]
         if self.move_state in self._move_config:
             return self._move_config[self.move_state]
         return self._state_config["idle"]
 
-    def tick(self) -> None:
-        cfg = self._active_config()
-        n_frames = len(cfg["sprites"])
-        self._tick_accum += self._TICK_MS
-
-        while self._tick_accum >= cfg["delay"]:
-            self._tick_accum -= cfg["delay"]
-            self.frame += 1
-
-            if self.frame >= n_frames:
-                if cfg.get("loop", True):
-                    self.frame = 0
-                else:
-                    self._loops_done += 1
-                    if self._loops_done < cfg.get("loops", 2):
-                        self.frame = 0
-                    else:
-                        self.state = cfg.get("next", "idle")
-                        self.frame = 0
-                        self._tick_accum = 0
-                        self._loops_done = 0
-                        break
+    def tick(self, elapsed_ms: int | None = None) -> None:
+        """Advance the animation by one frame, or by elapsed_ms if given."""
+        cfg = self._cfg
+        delay = cfg.delay
+        accum = self._tick_accum + (elapsed_ms or self._TICK_MS)
+
+        # Advance in closed form: O(1) even if many frame delays elapsed
+        advance = accum // delay
+        if not advance:
+            self._tick_accum = accum
+            return
+        self._tick_accum = accum - advance * delay
+        frame = self.frame + advance
+        n_frames = cfg.n_frames
+
+        if frame < n_frames:
+            self.frame = frame
+        elif cfg.loop:
+            self.frame = frame % n_frames
+        else:
+            plays, self.frame = divmod(frame, n_frames)
+            loops_done = self._loops_done + plays
+            if loops_done >= cfg.loops:
+                self.state = cfg.next
+                self.frame = 0
+                self._tick_accum = 0
+                loops_done = 0
+                self._cfg = self._resolve_config()
+            self._loops_done = loops_done
 
     def get_frame_delay(self) -> int:
-        return self._active_config()["delay"]
+        return self._active_config().delay
 
     # ------------------------------------------------------------------
     # Drawing
     # ------------------------------------------------------------------
 
-    def draw(self, ctx: cairo.Context, width: int, height: int) -> None:
-        cfg = self._active_config()
-        sprites = cfg["sprites"]
-        idx = sprites[self.frame % len(sprites)]
+    def get_sprite(self, idx: int) -> cairo.ImageSurface | None:
+        """Return sprite idx, decoding its PNG on first use.
+
+        None if the pack has no such sprite or it fails to load.
+        """
         surface = self._sprites.get(idx)
         if surface is None:
-            return
+            path = self._sprite_paths.get(idx)
+            if path is None:
+                return None
+            try:
+                surface = cairo.ImageSurface.create_from_png(path)
+            except (cairo.Error, OSError):
+                del self._sprite_paths[idx]  # don't retry every frame
+                return None
+            self._sprites[idx] = surface
+        return surface
+
+    def draw(self, ctx: cairo.Context, width: int, height: int) -> None:
+        cfg = self._cfg
+        idx = cfg.sprites[self.frame % cfg.n_frames]
+        flip = self.facing > 0
 
-        sprite_w = surface.get_width()
-        sprite_h = surface.get_height()
+        # Each sprite is scaled/flipped once per window size and then just
+        # blitted; a rescale invalidates the whole cache
+        if (width, height) != self._frame_cache_size:
+            self._frame_cache = {}
+            self._frame_cache_size = (width, height)
+        frame = self._frame_cache.get((idx, flip))
+        if frame is None:
+            surface = self.get_sprite(idx)
+            if surface is None:
+                return
+            frame = self._render_frame(surface, flip, width, height)
+            self._frame_cache[(idx, flip)] = frame
 
-        ctx.save()
+        ctx.set_source_surface(frame, 0, 0)
+        # Keeps pixels crisp if GTK's device scale (HiDPI) enlarges the blit
+        ctx.get_source().set_filter(cairo.FILTER_NEAREST)
+        ctx.paint()
 
-        # Scale sprite to fill the window
-        sx = width / sprite_w
-        sy = height / sprite_h
+    @staticmethod
+    def _render_frame(surface: cairo.ImageSurface, flip: bool,
+                      width: int, height: int) -> cairo.ImageSurface:
+        """Scale a sprite to fill width x height, flipped if facing right."""
+        frame = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+        ctx = cairo.Context(frame)
+        sx = width / surface.get_width()
+        sy = height / surface.get_height()
 
-        # Flip horizontally when facing right (sprites face left by default)
-        if self.facing > 0:
+        # Sprites face left by default
+        if flip:
             ctx.translate(width, 0)
             ctx.scale(-sx, sy)
         else:
@@ -272,4 +382,4 @@ class SpriteCharacter:
         ctx.set_source_surface(surface, 0, 0)
         ctx.get_source().set_filter(cairo.FILTER_NEAREST)
         ctx.paint()
-        ctx.restore()
+        return frame